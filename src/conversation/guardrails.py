@@ -16,7 +16,7 @@ from typing import Optional
 
 from src.config import settings
 from src.logging_context import get_call_logger
-from src.tools.services import get_valid_service_terms
+from src.tools.services import is_valid_service_term
 
 logger = get_call_logger(__name__)
 
@@ -55,10 +55,8 @@ class ScopeGuardrail:
     ]
 
     def check_service_scope(self, service: str) -> GuardrailResult:
-        normalized = service.lower().strip()
-        for valid in get_valid_service_terms():
-            if valid in normalized or normalized in valid:
-                return GuardrailResult(passed=True)
+        if is_valid_service_term(service):
+            return GuardrailResult(passed=True)
         return GuardrailResult(
             passed=False,
             violation_type="out_of_scope_service",
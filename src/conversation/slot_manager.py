@@ -21,7 +21,7 @@ from enum import Enum
 from typing import Any, Callable, Optional
 
 from src.config import settings
-from src.tools.services import get_valid_service_terms
+from src.tools.services import is_valid_service_term
 from src.utils import normalize_phone
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,8 @@ MIN_PHONE_DIGITS = 7
 MAX_PHONE_DIGITS = 15
 MIN_ADDRESS_LENGTH = 5
 
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+
 
 class SlotStatus(str, Enum):
     """Lifecycle status of a slot value."""
@@ -48,13 +50,12 @@ def _validate_name(value: str) -> bool:
 
 
 def _validate_phone(value: str) -> bool:
-    digits = re.sub(r"[^\d]", "", value)
+    digits = _NON_DIGIT_RE.sub("", value)
     return MIN_PHONE_DIGITS <= len(digits) <= MAX_PHONE_DIGITS
 
 
 def _validate_service(value: str) -> bool:
-    normalized = value.lower().strip()
-    return any(svc in normalized or normalized in svc for svc in get_valid_service_terms())
+    return is_valid_service_term(value)
 
 
 def _validate_date(value: str) -> bool:
@@ -15,7 +15,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +75,23 @@ class Transition:
     guard: Optional[Callable[[], bool]] = None
 
 
+def _index_transitions(
+    transitions: Iterable[Transition],
+) -> dict[ConversationState, dict[TransitionTrigger, tuple[Transition, ...]]]:
+    """Group transitions by source state, then trigger, keeping list order.
+
+    Order matters when several guarded transitions share a trigger: the
+    first one whose guard passes wins.
+    """
+    index: dict[ConversationState, dict[TransitionTrigger, list[Transition]]] = {}
+    for t in transitions:
+        index.setdefault(t.from_state, {}).setdefault(t.trigger, []).append(t)
+    return {
+        state: {trigger: tuple(ts) for trigger, ts in by_trigger.items()}
+        for state, by_trigger in index.items()
+    }
+
+
 @dataclass
 class StateEntry:
     """Recorded history entry for a state visit."""
@@ -97,7 +114,7 @@ class ConversationStateMachine:
     with a clear error indicating what transitions are allowed.
     """
 
-    TRANSITIONS: list[Transition] = [
+    TRANSITIONS: tuple[Transition, ...] = (
         # --- Greeting ---
         Transition(
             ConversationState.GREETING,
@@ -223,7 +240,15 @@ class ConversationStateMachine:
         Transition(
             ConversationState.FAREWELL, ConversationState.FAREWELL, TransitionTrigger.GOODBYE
         ),
-    ]
+    )
+
+    # Lookup table for transition() and get_valid_triggers(), derived from
+    # TRANSITIONS here and again for every subclass in __init_subclass__
+    _TRANSITIONS_BY_STATE = _index_transitions(TRANSITIONS)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._TRANSITIONS_BY_STATE = _index_transitions(cls.TRANSITIONS)
 
     def __init__(self) -> None:
         self._current_state = ConversationState.GREETING
@@ -253,32 +278,32 @@ class ConversationStateMachine:
         Raises:
             InvalidTransitionError: If no valid transition exists.
         """
-        for t in self.TRANSITIONS:
-            if t.from_state == self._current_state and t.trigger == trigger:
-                if t.guard is not None and not t.guard():
-                    continue
-
-                old_state = self._current_state
-                self._current_state = t.to_state
-
-                self._history.append(
-                    StateEntry(
-                        state=self._current_state,
-                        entered_at=datetime.now(timezone.utc),
-                        trigger=trigger,
-                    )
+        by_trigger = self._TRANSITIONS_BY_STATE.get(self._current_state, {})
+        for t in by_trigger.get(trigger, ()):
+            if t.guard is not None and not t.guard():
+                continue
+
+            old_state = self._current_state
+            self._current_state = t.to_state
+
+            self._history.append(
+                StateEntry(
+                    state=self._current_state,
+                    entered_at=datetime.now(timezone.utc),
+                    trigger=trigger,
                 )
+            )
 
-                if t.to_state == ConversationState.ERROR_RECOVERY:
-                    self._error_count += 1
+            if t.to_state == ConversationState.ERROR_RECOVERY:
+                self._error_count += 1
 
-                logger.debug(
-                    "State transition: %s -> %s (trigger: %s)",
-                    old_state.value,
-                    self._current_state.value,
-                    trigger.value,
-                )
-                return self._current_state
+            logger.debug(
+                "State transition: %s -> %s (trigger: %s)",
+                old_state.value,
+                self._current_state.value,
+                trigger.value,
+            )
+            return self._current_state
 
         valid = [t.value for t in self.get_valid_triggers()]
         raise InvalidTransitionError(
@@ -288,7 +313,7 @@ class ConversationStateMachine:
 
     def get_valid_triggers(self) -> list[TransitionTrigger]:
         """Return all triggers valid from the current state."""
-        return [t.trigger for t in self.TRANSITIONS if t.from_state == self._current_state]
+        return list(self._TRANSITIONS_BY_STATE.get(self._current_state, ()))
 
     def get_history(self) -> list[StateEntry]:
         """Return the full state transition history."""
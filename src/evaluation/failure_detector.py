@@ -7,25 +7,24 @@ each with severity and contextual evidence for root-cause analysis.
 
 import logging
 import re
-from dataclasses import dataclass
+from array import array
+from collections import defaultdict
 from enum import Enum
-from typing import Optional
+from typing import Any, Iterable, Optional, Sequence
 
 from src.config import settings
 from src.schemas.conversation_schema import CallOutcome, ConversationTranscript, Speaker
 
 logger = logging.getLogger(__name__)
 
-
-def _compile_patterns(phrases: list[str]) -> re.Pattern[str]:
-    """Compile a list of phrases into a single word-boundary regex."""
-    escaped = [re.escape(p) for p in phrases]
-    return re.compile(r"\b(?:" + "|".join(escaped) + r")\b", re.IGNORECASE)
+# Deferred text: a str.format template and its positional arguments
+_LazyText = tuple[str, tuple[Any, ...]]
 
 # Detection thresholds
 REPEATED_SLOT_THRESHOLD = 3
 CONFIRMATION_LOOP_THRESHOLD = 3
 MAX_REASONABLE_AGENTS = 3
+MISSED_INTENT_MIN_TURNS = 3  # user turn plus a two-turn response window
 INCOMPLETE_BOOKING_MIN_SLOTS = 4
 TOTAL_REQUIRED_SLOTS = 6
 
@@ -54,28 +53,323 @@ class FailureSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
 class DetectedFailure:
-    """A single detected failure with evidence."""
+    """A single detected failure with evidence.
+
+    ``evidence`` and ``recommendation`` can be deferred as ``(template, args)``
+    pairs via :meth:`_lazy`. The template is formatted on first access, so
+    callers that only filter or count by pattern/severity never build the
+    strings.
+    """
+
+    __slots__ = (
+        "pattern",
+        "severity",
+        "turn_index",
+        "_evidence",
+        "_recommendation",
+        "_evidence_fmt",
+        "_recommendation_fmt",
+    )
+
+    def __init__(
+        self,
+        pattern: FailurePattern,
+        severity: FailureSeverity,
+        evidence: str,
+        turn_index: Optional[int] = None,
+        recommendation: str = "",
+    ) -> None:
+        self.pattern = pattern
+        self.severity = severity
+        self.turn_index = turn_index
+        self._evidence = evidence
+        self._recommendation = recommendation
+        self._evidence_fmt: Optional[_LazyText] = None
+        self._recommendation_fmt: Optional[_LazyText] = None
+
+    @classmethod
+    def _lazy(
+        cls,
+        pattern: FailurePattern,
+        severity: FailureSeverity,
+        evidence_fmt: _LazyText,
+        turn_index: Optional[int] = None,
+        recommendation: str = "",
+        recommendation_fmt: Optional[_LazyText] = None,
+    ) -> "DetectedFailure":
+        """Build a failure whose evidence/recommendation are formatted on access."""
+        failure = cls(pattern, severity, "", turn_index, recommendation)
+        failure._evidence_fmt = evidence_fmt
+        failure._recommendation_fmt = recommendation_fmt
+        return failure
+
+    @property
+    def evidence(self) -> str:
+        if self._evidence_fmt is not None:
+            template, args = self._evidence_fmt
+            self._evidence = template.format(*args)
+            self._evidence_fmt = None
+        return self._evidence
+
+    @property
+    def recommendation(self) -> str:
+        if self._recommendation_fmt is not None:
+            template, args = self._recommendation_fmt
+            self._recommendation = template.format(*args)
+            self._recommendation_fmt = None
+        return self._recommendation
+
+    def _astuple(self) -> tuple[Any, ...]:
+        return (self.pattern, self.severity, self.evidence, self.turn_index, self.recommendation)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DetectedFailure):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __repr__(self) -> str:
+        return (
+            f"DetectedFailure(pattern={self.pattern!r}, severity={self.severity!r}, "
+            f"evidence={self.evidence!r}, turn_index={self.turn_index!r}, "
+            f"recommendation={self.recommendation!r})"
+        )
+
+
+_PATTERNS: tuple[FailurePattern, ...] = tuple(FailurePattern)
+_PATTERN_CODES: dict[FailurePattern, int] = {p: i for i, p in enumerate(_PATTERNS)}
+_SEVERITIES: tuple[FailureSeverity, ...] = tuple(FailureSeverity)
+_SEVERITY_CODES: dict[FailureSeverity, int] = {s: i for i, s in enumerate(_SEVERITIES)}
+_NO_TURN = -1
+
+
+class DetectedFailureBatch:
+    """Columnar (struct-of-arrays) view over a list of detected failures.
+
+    ``pattern`` and ``severity`` are int8 codes into ``FailurePattern`` /
+    ``FailureSeverity`` declaration order, and ``turn_index`` is int32 with
+    -1 for failures not tied to a turn. Aggregations such as counts by
+    pattern run over the typed columns without touching the row objects.
+    Evidence and recommendation text is only built when those columns are
+    read.
+    """
+
+    __slots__ = ("pattern", "severity", "turn_index", "_rows")
+
+    def __init__(self, rows: Sequence[DetectedFailure] = ()) -> None:
+        self._rows: tuple[DetectedFailure, ...] = tuple(rows)
+        self.pattern = array("b", [_PATTERN_CODES[f.pattern] for f in self._rows])
+        self.severity = array("b", [_SEVERITY_CODES[f.severity] for f in self._rows])
+        self.turn_index = array(
+            "i", [_NO_TURN if f.turn_index is None else f.turn_index for f in self._rows]
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable["DetectedFailureBatch"]) -> "DetectedFailureBatch":
+        """Join several batches (e.g. one per transcript) into one."""
+        merged = cls()
+        rows: list[DetectedFailure] = []
+        for batch in batches:
+            rows.extend(batch._rows)
+            merged.pattern.extend(batch.pattern)
+            merged.severity.extend(batch.severity)
+            merged.turn_index.extend(batch.turn_index)
+        merged._rows = tuple(rows)
+        return merged
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def evidence(self) -> list[str]:
+        return [f.evidence for f in self._rows]
+
+    @property
+    def recommendation(self) -> list[str]:
+        return [f.recommendation for f in self._rows]
+
+    def count_by_pattern(self) -> dict[FailurePattern, int]:
+        """Return occurrence counts for each pattern present in the batch."""
+        counts = {p: self.pattern.count(code) for p, code in _PATTERN_CODES.items()}
+        return {p: n for p, n in counts.items() if n}
+
+    def count_by_severity(self) -> dict[FailureSeverity, int]:
+        """Return occurrence counts for each severity present in the batch."""
+        counts = {s: self.severity.count(code) for s, code in _SEVERITY_CODES.items()}
+        return {s: n for s, n in counts.items() if n}
+
+    def to_failures(self) -> list[DetectedFailure]:
+        """Return the batch as a list of DetectedFailure rows."""
+        return list(self._rows)
+
+
+class _Keyword:
+    """Phrase categories looked for by the keyword-based detectors.
+
+    Plain string constants rather than an Enum: they are only used as dict
+    keys in the per-turn scan, and Enum's Python-level ``__hash__`` made each
+    of those lookups several times slower.
+    """
+
+    SLOT = "slot"
+    SLOT_QUESTION = "slot_question"
+    CONFIRMATION = "confirmation"
+    OUT_OF_SCOPE = "out_of_scope"
+    SCOPE_DEFLECTION = "scope_deflection"
+    HALLUCINATION = "hallucination"
+    ESCALATION_RESPONSE = "escalation_response"
+    BOOKING_RESPONSE = "booking_response"
+    INFO_RESPONSE = "info_response"
+    FRUSTRATION = "frustration"
+    BOOKING = "booking"
+    INFO = "info"
+    USER_ESCALATION = "user_escalation"
+
+
+# Matched phrases (lowercase, in text order) per category for one turn
+_KeywordHits = dict[str, list[str]]
+# A user turn awaiting an agent reply: (turn index, first frustration
+# phrase or None, booking intent, info intent)
+_PendingSignal = tuple[int, Optional[str], bool, bool]
+_NO_HITS: _KeywordHits = {}
+
+
+def _compile_phrases(phrases: list[str]) -> re.Pattern[str]:
+    """Compile a list of phrases into a single word-boundary regex."""
+    escaped = [re.escape(p) for p in phrases]
+    return re.compile(r"\b(?:" + "|".join(escaped) + r")\b", re.IGNORECASE)
+
+
+def _trie_alternation(phrases: Iterable[str]) -> str:
+    """Build a regex alternation of ``phrases`` factored into a prefix trie.
+
+    Sibling branches start with distinct characters, so at each position sre
+    follows at most one branch instead of trying every phrase in turn.
+    Branches that can stop early are greedy-optional, which keeps the
+    longest-phrase-first preference of a flat longest-first alternation.
+    """
+    trie: dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?" if branches else ""
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+def _has_partial_overlap(phrases: list[str]) -> bool:
+    """Whether a phrase can start inside another phrase and run past its end.
+
+    A plain alternation resumes after the end of each match, so it would
+    skip such a phrase. Phrases wholly contained in another are fine; they
+    are recovered from the scanner's expansion table.
+    """
+    for outer in phrases:
+        for boundary in re.finditer(r"\b", outer):
+            tail = outer[boundary.start():]
+            if boundary.start() == 0 or not tail:
+                continue
+            if any(len(p) > len(tail) and p.startswith(tail) for p in phrases):
+                return True
+    return False
+
+
+class _PhraseScanner:
+    """Single-pass multi-pattern matcher over one speaker's phrase tables.
+
+    Every phrase goes into one trie-shaped alternation (see
+    :func:`_trie_alternation`), so a single ``findall`` reports the longest
+    phrase at each match. Matching is case-insensitive. ASCII text is
+    lowercased and scanned without ``re.IGNORECASE``, which measured over
+    twice as fast. Other text falls back to one ``re.IGNORECASE`` regex per
+    table, because lowercasing can change its length (``"İ"`` becomes two
+    code points) and with it where ``\b`` word boundaries fall. Phrases
+    must be lowercase ASCII.
+
+    Each reported phrase expands to every phrase found inside it at word
+    boundaries (itself included), in text order and tagged with their
+    categories. This yields the same per-category matches as running a
+    separate word-boundary regex for each table, as long as no phrase can
+    start inside another and run past its end; such tables are rejected
+    with ``ValueError``. Phrases within one table must not overlap each
+    other.
+    """
+
+    def __init__(self, tables: dict[str, list[str]]) -> None:
+        categories: dict[str, list[str]] = {}
+        for category, phrases in tables.items():
+            for phrase in phrases:
+                categories.setdefault(phrase, []).append(category)
+        phrases = list(categories)
+
+        if _has_partial_overlap(phrases):
+            raise ValueError("phrases must not start inside another phrase and run past its end")
+        self._findall_lower = re.compile(r"\b(" + _trie_alternation(phrases) + r")\b").findall
+        self._table_findalls = [
+            (category, _compile_phrases(table_phrases).findall)
+            for category, table_phrases in tables.items()
+        ]
+
+        self._expansions: dict[str, tuple[tuple[str, str], ...]] = {}
+        for outer in phrases:
+            inner_hits = [
+                (hit.start(), inner)
+                for inner in phrases
+                for hit in re.finditer(r"(?=\b" + re.escape(inner) + r"\b)", outer)
+            ]
+            inner_hits.sort(key=lambda hit: hit[0])
+            self._expansions[outer] = tuple(
+                (category, inner) for _, inner in inner_hits for category in categories[inner]
+            )
 
-    pattern: FailurePattern
-    severity: FailureSeverity
-    evidence: str
-    turn_index: Optional[int] = None
-    recommendation: str = ""
+    def scan(self, text: str) -> _KeywordHits:
+        """Return the phrases found in ``text``, bucketed by category.
+
+        ``findall`` yields the matched text as bare strings, so no match
+        objects are built; turns without any match share :data:`_NO_HITS`.
+        Hits are reported lowercased.
+        """
+        if not text.isascii():
+            return self._scan_tables(text)
+        found = self._findall_lower(text.lower())
+        if not found:
+            return _NO_HITS
+        expansions = self._expansions
+        # A plain dict: most turns hit one or two categories, where creating a
+        # defaultdict costs more than the setdefault lists it would save
+        hits: _KeywordHits = {}
+        for phrase in found:
+            for category, matched in expansions[phrase]:
+                hits.setdefault(category, []).append(matched)
+        return hits
+
+    def _scan_tables(self, text: str) -> _KeywordHits:
+        """Scan non-ASCII ``text`` with one case-insensitive regex per table."""
+        hits: _KeywordHits = {}
+        for category, findall in self._table_findalls:
+            found = findall(text)
+            if found:
+                hits[category] = [match.lower() for match in found]
+        return hits or _NO_HITS
 
 
 _SLOT_KEYWORDS = ["name", "phone", "number", "address", "date", "time", "service"]
 _SLOT_QUESTION_WORDS = ["what", "could", "can you"]
-_SLOT_KW_RE = _compile_patterns(_SLOT_KEYWORDS)
-_SLOT_Q_RE = _compile_patterns(_SLOT_QUESTION_WORDS)
 
 _CONFIRMATION_PHRASES = [
     "does everything sound correct",
     "let me confirm",
     "here's what i have",
 ]
-_CONFIRMATION_RE = _compile_patterns(_CONFIRMATION_PHRASES)
 
 _OUT_OF_SCOPE_TOPICS = [
     "medical",
@@ -86,8 +380,7 @@ _OUT_OF_SCOPE_TOPICS = [
     "investment",
     "cryptocurrency",
 ]
-_OUT_OF_SCOPE_RE = _compile_patterns(_OUT_OF_SCOPE_TOPICS)
-_SCOPE_DEFLECTION_RE = _compile_patterns(["i can't help with", "outside"])
+_SCOPE_DEFLECTIONS = ["i can't help with", "outside"]
 
 _FRUSTRATION_PHRASES = [
     "i already told you",
@@ -100,8 +393,7 @@ _FRUSTRATION_PHRASES = [
     "worst service",
     "unacceptable",
 ]
-_FRUSTRATION_RE = _compile_patterns(_FRUSTRATION_PHRASES)
-_ESCALATION_RESPONSE_RE = _compile_patterns(["transfer", "connect", "apologize", "sorry"])
+_ESCALATION_RESPONSES = ["transfer", "connect", "apologize", "sorry"]
 
 _HALLUCINATION_CLAIMS = [
     "guarantee",
@@ -113,107 +405,243 @@ _HALLUCINATION_CLAIMS = [
     "fully insured",
     "fully licensed",
 ]
-_HALLUCINATION_RE = _compile_patterns(_HALLUCINATION_CLAIMS)
 
 _BOOKING_SIGNALS = ["book", "appointment", "schedule", "come out", "send someone"]
 _INFO_SIGNALS = ["how much", "price", "cost", "what services", "do you offer"]
-_BOOKING_RE = _compile_patterns(_BOOKING_SIGNALS)
-_INFO_RE = _compile_patterns(_INFO_SIGNALS)
-_BOOKING_RESPONSE_RE = _compile_patterns(["book", "name", "appointment", "schedule"])
-_INFO_RESPONSE_RE = _compile_patterns(["price", "service", "cost", "offer"])
-
-_USER_ESCALATION_RE = _compile_patterns(
-    ["manager", "supervisor", "human", "real person", "speak to"]
-)
+_BOOKING_RESPONSES = ["book", "name", "appointment", "schedule"]
+_INFO_RESPONSES = ["price", "service", "cost", "offer"]
+
+_USER_ESCALATION_PHRASES = ["manager", "supervisor", "human", "real person", "speak to"]
+
+_KEYWORD_TABLES: dict[Speaker, dict[str, list[str]]] = {
+    Speaker.AGENT: {
+        _Keyword.SLOT: _SLOT_KEYWORDS,
+        _Keyword.SLOT_QUESTION: _SLOT_QUESTION_WORDS,
+        _Keyword.CONFIRMATION: _CONFIRMATION_PHRASES,
+        _Keyword.OUT_OF_SCOPE: _OUT_OF_SCOPE_TOPICS,
+        _Keyword.SCOPE_DEFLECTION: _SCOPE_DEFLECTIONS,
+        _Keyword.HALLUCINATION: _HALLUCINATION_CLAIMS,
+        _Keyword.ESCALATION_RESPONSE: _ESCALATION_RESPONSES,
+        _Keyword.BOOKING_RESPONSE: _BOOKING_RESPONSES,
+        _Keyword.INFO_RESPONSE: _INFO_RESPONSES,
+    },
+    Speaker.USER: {
+        _Keyword.FRUSTRATION: _FRUSTRATION_PHRASES,
+        _Keyword.BOOKING: _BOOKING_SIGNALS,
+        _Keyword.INFO: _INFO_SIGNALS,
+        _Keyword.USER_ESCALATION: _USER_ESCALATION_PHRASES,
+    },
+}
+_SCANNERS = {speaker: _PhraseScanner(tables) for speaker, tables in _KEYWORD_TABLES.items()}
 
 
 class FailureDetector:
     """Detects failure patterns in conversation transcripts."""
 
     def detect_all(self, transcript: ConversationTranscript) -> list[DetectedFailure]:
-        """Run all detection methods and return all found failures."""
-        failures: list[DetectedFailure] = []
-
-        failures.extend(self._detect_repeated_slot_failure(transcript))
-        failures.extend(self._detect_confirmation_loop(transcript))
-        failures.extend(self._detect_wrong_agent_handoff(transcript))
-        failures.extend(self._detect_scope_violation(transcript))
-        failures.extend(self._detect_caller_frustration(transcript))
-        failures.extend(self._detect_hallucinated_info(transcript))
-        failures.extend(self._detect_missed_intent(transcript))
-        failures.extend(self._detect_incomplete_booking(transcript))
-        failures.extend(self._detect_unnecessary_escalation(transcript))
-        failures.extend(self._detect_slow_response(transcript))
+        """Run all detection methods and return all found failures.
+
+        Turn-level patterns are found in one pass by :meth:`_scan_turns`.
+        Transcript-level detectors run afterwards. Failures are returned
+        grouped in ``FailurePattern`` order.
+        """
+        # Transcripts without turns skip the per-turn scan. The
+        # transcript-level detectors each check their own preconditions.
+        if transcript.turns:
+            by_pattern, user_requested_escalation = self._scan_turns(transcript)
+        else:
+            by_pattern = {p: [] for p in _PATTERNS}
+            user_requested_escalation = False
+
+        by_pattern[FailurePattern.WRONG_AGENT_HANDOFF].extend(
+            self._detect_wrong_agent_handoff(transcript)
+        )
+        by_pattern[FailurePattern.INCOMPLETE_BOOKING].extend(
+            self._detect_incomplete_booking(transcript)
+        )
+        by_pattern[FailurePattern.UNNECESSARY_ESCALATION].extend(
+            self._detect_unnecessary_escalation(transcript, user_requested_escalation)
+        )
+
+        failures = [f for pattern in _PATTERNS for f in by_pattern[pattern]]
 
         if failures:
             logger.info("Detected %d failure(s) in call %s", len(failures), transcript.call_id)
 
         return failures
 
-    def _detect_repeated_slot_failure(
+    def detect_all_batch(self, transcript: ConversationTranscript) -> DetectedFailureBatch:
+        """Run all detection methods and return the failures in columnar form."""
+        return DetectedFailureBatch(self.detect_all(transcript))
+
+    def _scan_turns(
         self, transcript: ConversationTranscript
-    ) -> list[DetectedFailure]:
-        """Detect when the agent asks for the same information multiple times."""
-        failures: list[DetectedFailure] = []
-        slot_questions: dict[str, list[int]] = {}
+    ) -> tuple[dict[FailurePattern, list[DetectedFailure]], bool]:
+        """Run every turn-level detector in a single walk over the turns.
+
+        The turns are split into parallel speaker/text/response-time columns
+        so the hot loop in :meth:`_scan_columns` never touches the turn models.
+        """
+        turns = transcript.turns
+        return self._scan_columns(
+            [turn.speaker for turn in turns],
+            [turn.text for turn in turns],
+            [turn.response_time_ms for turn in turns],
+        )
+
+    def _scan_columns(
+        self,
+        speakers: Sequence[Speaker],
+        texts: Sequence[str],
+        response_times: Sequence[Optional[float]],
+    ) -> tuple[dict[FailurePattern, list[DetectedFailure]], bool]:
+        """Run the turn-level detectors over parallel per-turn columns.
+
+        Each agent/user text is lowercased once and matched with its
+        speaker's phrase scanner. Frustration and intent signals in a user
+        turn stay pending until the first agent turn of the next two turns
+        answers them, or the window passes without one.
+
+        Returns the failures keyed by pattern, and whether the caller asked
+        for a human at any point.
+        """
+        by_pattern: dict[FailurePattern, list[DetectedFailure]] = {p: [] for p in _PATTERNS}
+        n_turns = len(speakers)
+        threshold = settings.guardrails.slow_response_threshold_sec
+        # Response times are compared in milliseconds; seconds are only
+        # derived for the evidence of slow turns.
+        threshold_ms = threshold * 1000
+        # Texts are scanned turn by turn on purpose: one findall over a
+        # speaker's turns joined by a sentinel measured slower, because
+        # splitting its results back into turns costs more than the
+        # per-call overhead it saves on these short texts.
+        agent, user = Speaker.AGENT, Speaker.USER
+        agent_scan = _SCANNERS[agent].scan
+        user_scan = _SCANNERS[user].scan
+        resolve = self._resolve_signal
+        # Defaultdict: each slot is asked about many times per call, and
+        # setdefault would build a throwaway list on every repeat
+        slot_questions: defaultdict[str, list[int]] = defaultdict(list)
+        confirmation_count = 0
+        user_requested_escalation = False
+        pending: list[_PendingSignal] = []
+
+        for i, speaker in enumerate(speakers):
+            while pending and pending[0][0] + 2 < i:
+                resolve(pending.pop(0), _NO_HITS, n_turns, by_pattern)
+
+            if speaker == agent:
+                found = agent_scan(texts[i])
+                for signal in pending:
+                    resolve(signal, found, n_turns, by_pattern)
+                pending.clear()
+
+                if _Keyword.SLOT_QUESTION in found:
+                    for slot in found.get(_Keyword.SLOT, ()):
+                        slot_questions[slot].append(i)
+                if _Keyword.CONFIRMATION in found:
+                    confirmation_count += 1
+                    if confirmation_count >= CONFIRMATION_LOOP_THRESHOLD:
+                        by_pattern[FailurePattern.CONFIRMATION_LOOP].append(
+                            self._confirmation_loop_failure(confirmation_count, i)
+                        )
+                if _Keyword.SCOPE_DEFLECTION not in found:
+                    for topic in found.get(_Keyword.OUT_OF_SCOPE, ()):
+                        by_pattern[FailurePattern.SCOPE_VIOLATION].append(
+                            self._scope_violation_failure(topic, i)
+                        )
+                for claim in found.get(_Keyword.HALLUCINATION, ()):
+                    by_pattern[FailurePattern.HALLUCINATED_INFO].append(
+                        self._hallucinated_info_failure(claim, i)
+                    )
+                response_time_ms = response_times[i]
+                if response_time_ms and response_time_ms > threshold_ms:
+                    by_pattern[FailurePattern.SLOW_RESPONSE].append(
+                        self._slow_response_failure(i, response_time_ms, threshold)
+                    )
 
-        for i, turn in enumerate(transcript.turns):
-            if turn.speaker != Speaker.AGENT:
-                continue
-            text = turn.text
-            if not _SLOT_Q_RE.search(text):
-                continue
-            for match in _SLOT_KW_RE.finditer(text):
-                slot_questions.setdefault(match.group().lower(), []).append(i)
+            elif speaker == user:
+                found = user_scan(texts[i])
+                if _Keyword.USER_ESCALATION in found:
+                    user_requested_escalation = True
+                frustration = found.get(_Keyword.FRUSTRATION)
+                booking = _Keyword.BOOKING in found
+                info = _Keyword.INFO in found
+                if frustration or booking or info:
+                    pending.append((i, frustration[0] if frustration else None, booking, info))
+
+        for signal in pending:
+            resolve(signal, _NO_HITS, n_turns, by_pattern)
 
         for slot, indices in slot_questions.items():
             if len(indices) >= REPEATED_SLOT_THRESHOLD:
-                failures.append(
-                    DetectedFailure(
-                        pattern=FailurePattern.REPEATED_SLOT_FAILURE,
-                        severity=FailureSeverity.HIGH,
-                        evidence=f"Agent asked for '{slot}' {len(indices)} times (turns {indices})",
-                        turn_index=indices[-1],
-                        recommendation=(
-                            f"Improve {slot} slot extraction"
-                            " — add normalization or"
-                            " clarification prompts."
-                        ),
-                    )
+                by_pattern[FailurePattern.REPEATED_SLOT_FAILURE].append(
+                    self._repeated_slot_failure(slot, indices)
                 )
 
-        return failures
-
-    def _detect_confirmation_loop(
-        self, transcript: ConversationTranscript
-    ) -> list[DetectedFailure]:
-        """Detect when confirmation is read back multiple times without progress."""
-        failures = []
-        confirmation_count = 0
-
-        for i, turn in enumerate(transcript.turns):
-            if turn.speaker == Speaker.AGENT:
-                if _CONFIRMATION_RE.search(turn.text):
-                    confirmation_count += 1
-                    if confirmation_count >= CONFIRMATION_LOOP_THRESHOLD:
-                        failures.append(
-                            DetectedFailure(
-                                pattern=FailurePattern.CONFIRMATION_LOOP,
-                                severity=FailureSeverity.MEDIUM,
-                                evidence=(
-                                    "Confirmation read-back repeated"
-                                    f" {confirmation_count} times"
-                                ),
-                                turn_index=i,
-                                recommendation=(
-                                    "Add logic to detect repeated"
-                                    " confirmations and offer to"
-                                    " correct specific fields."
-                                ),
-                            )
-                        )
+        return by_pattern, user_requested_escalation
+
+    def _resolve_signal(
+        self,
+        signal: _PendingSignal,
+        agent_found: _KeywordHits,
+        n_turns: int,
+        by_pattern: dict[FailurePattern, list[DetectedFailure]],
+    ) -> None:
+        """Check a pending user signal against the agent turn that answered it.
+
+        ``agent_found`` is empty when no agent turn followed within the window.
+        """
+        i, frustration, booking, info = signal
+        if frustration is not None and _Keyword.ESCALATION_RESPONSE not in agent_found:
+            by_pattern[FailurePattern.CALLER_FRUSTRATION].append(
+                self._caller_frustration_failure(frustration, i)
+            )
+        if booking or info:
+            addressed = (booking and _Keyword.BOOKING_RESPONSE in agent_found) or (
+                info and _Keyword.INFO_RESPONSE in agent_found
+            )
+            if not addressed and i <= n_turns - MISSED_INTENT_MIN_TURNS:
+                by_pattern[FailurePattern.MISSED_INTENT].append(
+                    self._missed_intent_failure("booking" if booking else "info", i)
+                )
 
-        return failures
+    @staticmethod
+    def _repeated_slot_failure(slot: str, indices: list[int]) -> DetectedFailure:
+        """The agent asked for the same information multiple times."""
+        return DetectedFailure._lazy(
+            pattern=FailurePattern.REPEATED_SLOT_FAILURE,
+            severity=FailureSeverity.HIGH,
+            evidence_fmt=(
+                "Agent asked for '{}' {} times (turns {})",
+                (slot, len(indices), indices),
+            ),
+            turn_index=indices[-1],
+            recommendation_fmt=(
+                "Improve {} slot extraction"
+                " — add normalization or"
+                " clarification prompts.",
+                (slot,),
+            ),
+        )
+
+    @staticmethod
+    def _confirmation_loop_failure(confirmation_count: int, i: int) -> DetectedFailure:
+        """Confirmation was read back multiple times without progress."""
+        return DetectedFailure._lazy(
+            pattern=FailurePattern.CONFIRMATION_LOOP,
+            severity=FailureSeverity.MEDIUM,
+            evidence_fmt=(
+                "Confirmation read-back repeated {} times",
+                (confirmation_count,),
+            ),
+            turn_index=i,
+            recommendation=(
+                "Add logic to detect repeated"
+                " confirmations and offer to"
+                " correct specific fields."
+            ),
+        )
 
     def _detect_wrong_agent_handoff(
         self, transcript: ConversationTranscript
@@ -224,159 +652,92 @@ class FailureDetector:
 
         if len(agents_used) > MAX_REASONABLE_AGENTS:
             failures.append(
-                DetectedFailure(
+                DetectedFailure._lazy(
                     pattern=FailurePattern.WRONG_AGENT_HANDOFF,
                     severity=FailureSeverity.MEDIUM,
-                    evidence=f"Caller passed through {len(agents_used)} agents: {agents_used}",
+                    evidence_fmt=(
+                        "Caller passed through {} agents: {}",
+                        # Copied, so later changes to the transcript can't
+                        # reach the evidence formatted from it
+                        (len(agents_used), list(agents_used)),
+                    ),
                     recommendation="Review intent detection to reduce unnecessary handoffs.",
                 )
             )
 
         return failures
 
-    def _detect_scope_violation(self, transcript: ConversationTranscript) -> list[DetectedFailure]:
-        """Detect when the agent responds to out-of-scope topics."""
-        failures = []
-
-        for i, turn in enumerate(transcript.turns):
-            if turn.speaker == Speaker.AGENT:
-                text = turn.text
-                if _SCOPE_DEFLECTION_RE.search(text):
-                    continue
-                for match in _OUT_OF_SCOPE_RE.finditer(text):
-                    topic = match.group().lower()
-                    failures.append(
-                        DetectedFailure(
-                            pattern=FailurePattern.SCOPE_VIOLATION,
-                            severity=FailureSeverity.HIGH,
-                            evidence=(
-                                f"Agent response contains"
-                                f" out-of-scope topic"
-                                f" '{topic}' at turn {i}"
-                            ),
-                            turn_index=i,
-                            recommendation=(
-                                "Add scope guardrail for"
-                                f" '{topic}' topic."
-                            ),
-                        )
-                    )
-
-        return failures
-
-    def _detect_caller_frustration(
-        self, transcript: ConversationTranscript
-    ) -> list[DetectedFailure]:
-        """Detect signs of caller frustration not addressed by escalation."""
-        failures = []
-
-        for i, turn in enumerate(transcript.turns):
-            if turn.speaker != Speaker.USER:
-                continue
-            match = _FRUSTRATION_RE.search(turn.text)
-            if not match:
-                continue
-            keyword = match.group().lower()
-            # Check if next agent turn addresses it
-            escalated = False
-            for j in range(i + 1, min(i + 3, len(transcript.turns))):
-                if transcript.turns[j].speaker == Speaker.AGENT:
-                    if _ESCALATION_RESPONSE_RE.search(transcript.turns[j].text):
-                        escalated = True
-                    break
-            if not escalated:
-                failures.append(
-                    DetectedFailure(
-                        pattern=FailurePattern.CALLER_FRUSTRATION,
-                        severity=FailureSeverity.CRITICAL,
-                        evidence=(
-                            f"Caller frustration"
-                            f" ('{keyword}') at turn"
-                            f" {i} not addressed"
-                        ),
-                        turn_index=i,
-                        recommendation=(
-                            "Add frustration detection"
-                            " in guardrails and"
-                            " auto-escalate."
-                        ),
-                    )
-                )
-
-        return failures
-
-    def _detect_hallucinated_info(
-        self, transcript: ConversationTranscript
-    ) -> list[DetectedFailure]:
-        """Detect when the agent makes claims not grounded in tool data."""
-        failures = []
-
-        for i, turn in enumerate(transcript.turns):
-            if turn.speaker != Speaker.AGENT:
-                continue
-            for match in _HALLUCINATION_RE.finditer(turn.text):
-                claim = match.group().lower()
-                failures.append(
-                    DetectedFailure(
-                        pattern=FailurePattern.HALLUCINATED_INFO,
-                        severity=FailureSeverity.HIGH,
-                        evidence=(
-                            f"Agent used unverified claim"
-                            f" '{claim}' at turn {i}"
-                        ),
-                        turn_index=i,
-                        recommendation=(
-                            "Add post-LLM guardrail to"
-                            f" block '{claim}' claims."
-                        ),
-                    )
-                )
-
-        return failures
-
-    def _detect_missed_intent(self, transcript: ConversationTranscript) -> list[DetectedFailure]:
-        """Detect when a clear caller intent is not acted upon."""
-        failures = []
-
-        for i, turn in enumerate(transcript.turns):
-            if turn.speaker != Speaker.USER:
-                continue
-            has_booking_intent = bool(_BOOKING_RE.search(turn.text))
-            has_info_intent = bool(_INFO_RE.search(turn.text))
-
-            if has_booking_intent or has_info_intent:
-                # Check if agent responds appropriately within next 2 turns
-                addressed = False
-                for j in range(i + 1, min(i + 3, len(transcript.turns))):
-                    if transcript.turns[j].speaker == Speaker.AGENT:
-                        agent_text = transcript.turns[j].text
-                        if has_booking_intent and _BOOKING_RESPONSE_RE.search(agent_text):
-                            addressed = True
-                        if has_info_intent and _INFO_RESPONSE_RE.search(agent_text):
-                            addressed = True
-                        break
-
-                if not addressed and i < len(transcript.turns) - 2:
-                    intent = "booking" if has_booking_intent else "info"
-                    failures.append(
-                        DetectedFailure(
-                            pattern=FailurePattern.MISSED_INTENT,
-                            severity=FailureSeverity.HIGH,
-                            evidence=(
-                                f"Caller expressed {intent}"
-                                f" intent at turn {i} but"
-                                " agent didn't respond"
-                                " appropriately"
-                            ),
-                            turn_index=i,
-                            recommendation=(
-                                "Improve intent detection"
-                                f" for {intent} keywords."
-                            ),
-                        )
-                    )
-
-        return failures
+    @staticmethod
+    def _scope_violation_failure(topic: str, i: int) -> DetectedFailure:
+        """The agent responded to an out-of-scope topic."""
+        return DetectedFailure._lazy(
+            pattern=FailurePattern.SCOPE_VIOLATION,
+            severity=FailureSeverity.HIGH,
+            evidence_fmt=(
+                "Agent response contains"
+                " out-of-scope topic"
+                " '{}' at turn {}",
+                (topic, i),
+            ),
+            turn_index=i,
+            recommendation_fmt=(
+                "Add scope guardrail for '{}' topic.",
+                (topic,),
+            ),
+        )
+
+    @staticmethod
+    def _caller_frustration_failure(keyword: str, i: int) -> DetectedFailure:
+        """Caller frustration was not addressed by escalation."""
+        return DetectedFailure._lazy(
+            pattern=FailurePattern.CALLER_FRUSTRATION,
+            severity=FailureSeverity.CRITICAL,
+            evidence_fmt=(
+                "Caller frustration ('{}') at turn {} not addressed",
+                (keyword, i),
+            ),
+            turn_index=i,
+            recommendation=(
+                "Add frustration detection"
+                " in guardrails and"
+                " auto-escalate."
+            ),
+        )
+
+    @staticmethod
+    def _hallucinated_info_failure(claim: str, i: int) -> DetectedFailure:
+        """The agent made a claim not grounded in tool data."""
+        return DetectedFailure._lazy(
+            pattern=FailurePattern.HALLUCINATED_INFO,
+            severity=FailureSeverity.HIGH,
+            evidence_fmt=(
+                "Agent used unverified claim '{}' at turn {}",
+                (claim, i),
+            ),
+            turn_index=i,
+            recommendation_fmt=(
+                "Add post-LLM guardrail to block '{}' claims.",
+                (claim,),
+            ),
+        )
+
+    @staticmethod
+    def _missed_intent_failure(intent: str, i: int) -> DetectedFailure:
+        """A clear caller intent was not acted upon."""
+        return DetectedFailure._lazy(
+            pattern=FailurePattern.MISSED_INTENT,
+            severity=FailureSeverity.HIGH,
+            evidence_fmt=(
+                "Caller expressed {} intent at turn {}"
+                " but agent didn't respond appropriately",
+                (intent, i),
+            ),
+            turn_index=i,
+            recommendation_fmt=(
+                "Improve intent detection for {} keywords.",
+                (intent,),
+            ),
+        )
 
     def _detect_incomplete_booking(
         self, transcript: ConversationTranscript
@@ -410,31 +771,26 @@ class FailureDetector:
         return failures
 
     def _detect_unnecessary_escalation(
-        self, transcript: ConversationTranscript
+        self, transcript: ConversationTranscript, user_requested: bool
     ) -> list[DetectedFailure]:
-        """Detect when a call was escalated but could have been resolved automatically."""
+        """Detect when a call was escalated but could have been resolved automatically.
+
+        ``user_requested`` is whether the caller asked for a human, as found
+        by :meth:`_scan_turns`.
+        """
         failures: list[DetectedFailure] = []
 
         if transcript.outcome != CallOutcome.ESCALATED:
             return failures
 
-        # Check if user actually requested escalation
-        user_requested = False
-        for turn in transcript.turns:
-            if turn.speaker == Speaker.USER:
-                if _USER_ESCALATION_RE.search(turn.text):
-                    user_requested = True
-                    break
-
         if not user_requested and transcript.error_count < settings.guardrails.confusion_threshold:
             failures.append(
-                DetectedFailure(
+                DetectedFailure._lazy(
                     pattern=FailurePattern.UNNECESSARY_ESCALATION,
                     severity=FailureSeverity.MEDIUM,
-                    evidence=(
-                        "Call escalated with only"
-                        f" {transcript.error_count} errors"
-                        " and no user request for human"
+                    evidence_fmt=(
+                        "Call escalated with only {} errors and no user request for human",
+                        (transcript.error_count,),
                     ),
                     recommendation=(
                         "Review escalation triggers"
@@ -446,31 +802,22 @@ class FailureDetector:
 
         return failures
 
-    def _detect_slow_response(self, transcript: ConversationTranscript) -> list[DetectedFailure]:
-        """Detect when agent responses took too long."""
-        failures = []
-        threshold = settings.guardrails.slow_response_threshold_sec
-
-        for i, turn in enumerate(transcript.turns):
-            if turn.speaker == Speaker.AGENT and turn.response_time_ms:
-                response_sec = turn.response_time_ms / 1000
-                if response_sec > threshold:
-                    failures.append(
-                        DetectedFailure(
-                            pattern=FailurePattern.SLOW_RESPONSE,
-                            severity=FailureSeverity.LOW,
-                            evidence=(
-                                f"Response at turn {i} took"
-                                f" {response_sec:.1f}s"
-                                f" (threshold: {threshold}s)"
-                            ),
-                            turn_index=i,
-                            recommendation=(
-                                "Optimize tool calls or"
-                                " reduce prompt complexity"
-                                " for faster responses."
-                            ),
-                        )
-                    )
-
-        return failures
+    @staticmethod
+    def _slow_response_failure(
+        i: int, response_time_ms: float, threshold: float
+    ) -> DetectedFailure:
+        """An agent response took too long."""
+        return DetectedFailure._lazy(
+            pattern=FailurePattern.SLOW_RESPONSE,
+            severity=FailureSeverity.LOW,
+            evidence_fmt=(
+                "Response at turn {} took {:.1f}s (threshold: {}s)",
+                (i, response_time_ms / 1000, threshold),
+            ),
+            turn_index=i,
+            recommendation=(
+                "Optimize tool calls or"
+                " reduce prompt complexity"
+                " for faster responses."
+            ),
+        )
@@ -7,7 +7,9 @@ from a ConversationTranscript instance.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Sequence
 
 from src.config import settings
 from src.schemas.conversation_schema import CallOutcome, ConversationTranscript
@@ -45,132 +47,147 @@ class EvalMetrics:
     hallucination_detection_rate: float = 0.0
 
 
+_REQUIRED_SLOTS = (
+    "customer_name",
+    "customer_phone",
+    "service_type",
+    "preferred_date",
+    "preferred_time",
+    "customer_address",
+)
+
+# Report layout for MetricsCalculator.format_report, filled in one % pass
+_REPORT_TEMPLATE = "\n".join(
+    [
+        "=" * 60,
+        "VOICE AGENT EVALUATION REPORT",
+        "=" * 60,
+        "",
+        "TASK SUCCESS",
+        "  Success rate:           %.1f%%  (target: %.0f%%)",
+        "  First-call resolution:  %.1f%%",
+        "  Containment rate:       %.1f%%  (target: %.0f%%)",
+        "",
+        "SLOT QUALITY",
+        "  Fill rate:              %.1f%%  (target: %.0f%%)",
+        "  Correction rate:        %.1f%%",
+        "  Avg attempts per slot:  %.1f",
+        "  Confirmation pass rate: %.1f%%",
+        "",
+        "EFFICIENCY",
+        "  Avg turns to booking:   %.1f  (target: <%s)",
+        "  Avg duration:           %.0fs",
+        "  Handoff rate:           %.1f%%",
+        "",
+        "ERRORS",
+        "  Error rate:             %.1f%%",
+        "  Recovery success rate:  %.1f%%",
+        "  Escalation rate:        %.1f%%  (target: <%.0f%%)",
+        "",
+        "GUARDRAILS",
+        "  Scope violation rate:   %.1f%%",
+        "  Hallucination det rate: %.1f%%",
+        "=" * 60,
+    ]
+)
+
+# Reads every metric of an EvalMetrics as a tuple in field order
+_metric_row = attrgetter(*(f.name for f in fields(EvalMetrics)))
+
+
 class MetricsCalculator:
     """Calculates evaluation metrics from conversation transcripts."""
 
     def calculate(self, transcript: ConversationTranscript) -> EvalMetrics:
         """Calculate all KPIs from a single transcript."""
-        metrics = EvalMetrics()
-
+        # Each transcript field is read once and every metric is passed to a
+        # single EvalMetrics constructor call.
+        outcome = transcript.outcome
+        booked = 1.0 if outcome == CallOutcome.BOOKING_MADE else 0.0
+        escalated = 1.0 if outcome == CallOutcome.ESCALATED else 0.0
         total_turns = len(transcript.turns)
-
-        # Task success
-        metrics.success_rate = 1.0 if transcript.outcome == CallOutcome.BOOKING_MADE else 0.0
-        metrics.first_call_resolution = (
-            1.0
-            if transcript.outcome in (CallOutcome.BOOKING_MADE, CallOutcome.INFO_PROVIDED)
-            else 0.0
-        )
-        metrics.containment_rate = 1.0 if transcript.outcome != CallOutcome.ESCALATED else 0.0
+        turn_denominator = max(total_turns, 1)
+        metadata = transcript.metadata or {}
 
         # Slot quality
         slots_collected = transcript.slots_collected or {}
-        required_slots = [
-            "customer_name",
-            "customer_phone",
-            "service_type",
-            "preferred_date",
-            "preferred_time",
-            "customer_address",
-        ]
-        total_required = len(required_slots)
-        filled = sum(1 for key in required_slots if slots_collected.get(key))
-        metrics.slot_fill_rate = filled / total_required
-
-        corrections = transcript.metadata.get("corrections", 0) if transcript.metadata else 0
-        total_attempts = (
-            transcript.metadata.get("total_attempts", filled) if transcript.metadata else filled
-        )
-        metrics.slot_correction_rate = corrections / max(filled, 1)
-        metrics.avg_slot_attempts = total_attempts / max(filled, 1)
-        metrics.confirmation_pass_rate = (
-            1.0 if transcript.outcome == CallOutcome.BOOKING_MADE else 0.0
-        )
+        filled = sum(1 for key in _REQUIRED_SLOTS if slots_collected.get(key))
+        filled_denominator = max(filled, 1)
+        corrections = metadata.get("corrections", 0)
+        total_attempts = metadata.get("total_attempts", filled)
 
         # Efficiency
-        metrics.avg_turns_to_booking = (
-            float(total_turns) if transcript.outcome == CallOutcome.BOOKING_MADE else 0.0
-        )
-        metrics.avg_duration_seconds = transcript.duration_seconds or 0.0
-
-        agents_used = transcript.agents_used or []
-        handoff_count = max(len(agents_used) - 1, 0)
-        metrics.handoff_rate = min(handoff_count / max(total_turns, 1), 1.0)
+        handoff_count = max(len(transcript.agents_used or []) - 1, 0)
 
         # Errors
-        metrics.error_rate = transcript.error_count / max(total_turns, 1)
-        if transcript.error_count > 0:
-            recovery_count = transcript.metadata.get("recoveries", 0) if transcript.metadata else 0
-            metrics.recovery_success_rate = recovery_count / transcript.error_count
-        metrics.escalation_rate = 1.0 if transcript.outcome == CallOutcome.ESCALATED else 0.0
-
-        # Guardrails
-        if transcript.metadata:
-            scope_checks = transcript.metadata.get("scope_checks", 0)
-            scope_violations = transcript.metadata.get("scope_violations", 0)
-            metrics.scope_violation_rate = scope_violations / max(scope_checks, 1)
-
-            hallucination_checks = transcript.metadata.get("hallucination_checks", 0)
-            hallucinations = transcript.metadata.get("hallucinations_detected", 0)
-            metrics.hallucination_detection_rate = hallucinations / max(hallucination_checks, 1)
+        error_count = transcript.error_count
+        recovery_success_rate = (
+            metadata.get("recoveries", 0) / error_count if error_count > 0 else 0.0
+        )
 
-        return metrics
+        return EvalMetrics(
+            success_rate=booked,
+            first_call_resolution=(
+                1.0 if outcome in (CallOutcome.BOOKING_MADE, CallOutcome.INFO_PROVIDED) else 0.0
+            ),
+            containment_rate=1.0 - escalated,
+            slot_fill_rate=filled / len(_REQUIRED_SLOTS),
+            slot_correction_rate=corrections / filled_denominator,
+            avg_slot_attempts=total_attempts / filled_denominator,
+            confirmation_pass_rate=booked,
+            avg_turns_to_booking=float(total_turns) if booked else 0.0,
+            avg_duration_seconds=transcript.duration_seconds or 0.0,
+            handoff_rate=min(handoff_count / turn_denominator, 1.0),
+            error_rate=error_count / turn_denominator,
+            recovery_success_rate=recovery_success_rate,
+            escalation_rate=escalated,
+            scope_violation_rate=(
+                metadata.get("scope_violations", 0) / max(metadata.get("scope_checks", 0), 1)
+            ),
+            hallucination_detection_rate=(
+                metadata.get("hallucinations_detected", 0)
+                / max(metadata.get("hallucination_checks", 0), 1)
+            ),
+        )
 
     def calculate_batch(self, transcripts: list[ConversationTranscript]) -> EvalMetrics:
         """Calculate averaged metrics across a batch of transcripts."""
-        if not transcripts:
-            return EvalMetrics()
+        return self.average([self.calculate(t) for t in transcripts])
 
-        all_metrics = [self.calculate(t) for t in transcripts]
-        n = len(all_metrics)
+    def average(self, metrics: Sequence[EvalMetrics]) -> EvalMetrics:
+        """Average already-calculated metrics field by field."""
+        if not metrics:
+            return EvalMetrics()
 
-        averaged = EvalMetrics()
-        for attr in vars(averaged):
-            if attr.startswith("_"):
-                continue
-            total = sum(getattr(m, attr) for m in all_metrics)
-            setattr(averaged, attr, total / n)
+        # One row tuple per transcript, transposed into one column per metric
+        rows = [_metric_row(m) for m in metrics]
+        n = len(rows)
 
-        return averaged
+        return EvalMetrics(*(sum(column) / n for column in zip(*rows)))
 
     def format_report(self, metrics: EvalMetrics) -> str:
         """Format metrics into a human-readable report."""
         targets = settings.evaluation
-
-        lines = [
-            "=" * 60,
-            "VOICE AGENT EVALUATION REPORT",
-            "=" * 60,
-            "",
-            "TASK SUCCESS",
-            f"  Success rate:           {metrics.success_rate:.1%}"
-            f"  (target: {targets.target_success_rate:.0%})",
-            f"  First-call resolution:  {metrics.first_call_resolution:.1%}",
-            f"  Containment rate:       {metrics.containment_rate:.1%}"
-            f"  (target: {targets.target_containment_rate:.0%})",
-            "",
-            "SLOT QUALITY",
-            f"  Fill rate:              {metrics.slot_fill_rate:.1%}"
-            f"  (target: {targets.target_slot_fill_rate:.0%})",
-            f"  Correction rate:        {metrics.slot_correction_rate:.1%}",
-            f"  Avg attempts per slot:  {metrics.avg_slot_attempts:.1f}",
-            f"  Confirmation pass rate: {metrics.confirmation_pass_rate:.1%}",
-            "",
-            "EFFICIENCY",
-            f"  Avg turns to booking:   {metrics.avg_turns_to_booking:.1f}"
-            f"  (target: <{targets.target_max_turns})",
-            f"  Avg duration:           {metrics.avg_duration_seconds:.0f}s",
-            f"  Handoff rate:           {metrics.handoff_rate:.1%}",
-            "",
-            "ERRORS",
-            f"  Error rate:             {metrics.error_rate:.1%}",
-            f"  Recovery success rate:  {metrics.recovery_success_rate:.1%}",
-            f"  Escalation rate:        {metrics.escalation_rate:.1%}"
-            f"  (target: <{targets.target_escalation_rate:.0%})",
-            "",
-            "GUARDRAILS",
-            f"  Scope violation rate:   {metrics.scope_violation_rate:.1%}",
-            f"  Hallucination det rate: {metrics.hallucination_detection_rate:.1%}",
-            "=" * 60,
-        ]
-        return "\n".join(lines)
+        # Rates are scaled to percent here, as the "%" format spec would
+        return _REPORT_TEMPLATE % (
+            metrics.success_rate * 100,
+            targets.target_success_rate * 100,
+            metrics.first_call_resolution * 100,
+            metrics.containment_rate * 100,
+            targets.target_containment_rate * 100,
+            metrics.slot_fill_rate * 100,
+            targets.target_slot_fill_rate * 100,
+            metrics.slot_correction_rate * 100,
+            metrics.avg_slot_attempts,
+            metrics.confirmation_pass_rate * 100,
+            metrics.avg_turns_to_booking,
+            targets.target_max_turns,
+            metrics.avg_duration_seconds,
+            metrics.handoff_rate * 100,
+            metrics.error_rate * 100,
+            metrics.recovery_success_rate * 100,
+            metrics.escalation_rate * 100,
+            targets.target_escalation_rate * 100,
+            metrics.scope_violation_rate * 100,
+            metrics.hallucination_detection_rate * 100,
+        )
@@ -4,6 +4,7 @@ CLI entry point for running evaluation on transcript files.
 Usage:
     python -m src.evaluation.run_eval --transcripts sample_transcripts/ --verbose
     python -m src.evaluation.run_eval --transcripts sample_transcripts/ --report report.txt
+    python -m src.evaluation.run_eval --transcripts sample_transcripts/ --workers 4
 """
 
 import argparse
@@ -32,6 +33,12 @@ def main() -> None:
         default=None,
         help="Path to write the evaluation report (default: stdout).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, analyze in-process).",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -57,15 +64,14 @@ def main() -> None:
         sys.exit(1)
 
     analyzer = TranscriptAnalyzer()
-    transcripts = analyzer.load_directory(transcript_dir)
+    report = analyzer.analyze_directory(transcript_dir, workers=args.workers)
 
-    if not transcripts:
+    if not report.total_calls:
         logger.error("No valid transcripts found in %s", transcript_dir)
         sys.exit(1)
 
-    logger.info("Loaded %d transcript(s) from %s", len(transcripts), transcript_dir)
+    logger.info("Analyzed %d transcript(s) from %s", report.total_calls, transcript_dir)
 
-    report = analyzer.analyze_batch(transcripts)
     output = analyzer.format_batch_report(report)
 
     if args.report:
@@ -16,6 +16,8 @@ import logging
 from contextvars import ContextVar
 
 _call_id: ContextVar[str] = ContextVar("call_id", default="NO_CALL_ID")
+# Bound once so the per-record filter skips the attribute lookup
+_get_call_id = _call_id.get
 
 
 def set_call_id(call_id: str) -> None:
@@ -25,24 +27,28 @@ def set_call_id(call_id: str) -> None:
 
 def get_call_id() -> str:
     """Retrieve the current correlation ID."""
-    return _call_id.get()
+    return _get_call_id()
 
 
 class CallIdFilter(logging.Filter):
     """Injects call_id into every log record."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        record.call_id = _call_id.get()  # type: ignore[attr-defined]
+        record.call_id = _get_call_id()  # type: ignore[attr-defined]
         return True
 
 
+# Filters carry no state, so every logger shares this one instance
+_CALL_ID_FILTER = CallIdFilter()
+
+
 def get_call_logger(name: str) -> logging.Logger:
     """Return a logger with the CallIdFilter attached.
 
     The filter adds ``call_id`` to each record so formatters can
-    include ``%(call_id)s`` in their format string.
+    include ``%(call_id)s`` in their format string. ``addFilter`` skips
+    a filter that is already attached, so repeat calls are no-ops.
     """
     logger = logging.getLogger(name)
-    if not any(isinstance(f, CallIdFilter) for f in logger.filters):
-        logger.addFilter(CallIdFilter())
+    logger.addFilter(_CALL_ID_FILTER)
     return logger
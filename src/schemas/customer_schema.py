@@ -17,7 +17,7 @@ class Customer(BaseModel):
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionData:
     """
     Per-session structured data shared across all agents.
@@ -51,11 +51,17 @@ TECHNICIANS: dict[str, list[str]] = {
     "drain cleaning": ["Mike T.", "Dave W."],
     "emergency repair": ["Mike T.", "James K.", "Dave W."],
 }
+_DEFAULT_TECHNICIANS = TECHNICIANS["general handyman"]
 
 
-def _generate_schedule() -> dict[str, dict]:
-    """Generate a realistic 14-day schedule with ~70% availability."""
-    schedule: dict[str, dict] = {}
+def _generate_schedule() -> tuple[dict[str, str], dict[str, tuple[str, ...]]]:
+    """
+    Generate a realistic 14-day schedule with ~70% availability.
+
+    Returns the day name and the ordered available times for each open date.
+    """
+    day_names: dict[str, str] = {}
+    times: dict[str, tuple[str, ...]] = {}
     base = datetime.now(tz=timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
 
     for day_offset in range(1, SCHEDULE_DAYS + 1):
@@ -64,20 +70,30 @@ def _generate_schedule() -> dict[str, dict]:
             continue
 
         date_str = date.strftime("%Y-%m-%d")
-        day_name = date.strftime("%A")
-
         hours = [9, 10, 11, 12, 13] if date.weekday() == 5 else [8, 9, 10, 11, 13, 14, 15, 16, 17]
 
-        available_times = [
+        day_names[date_str] = date.strftime("%A")
+        times[date_str] = tuple(
             f"{h:02d}:00" for h in hours if random.random() < AVAILABILITY_PROBABILITY
-        ]
-        schedule[date_str] = {"day_name": day_name, "times": available_times}
+        )
 
-    return schedule
+    return day_names, times
 
 
 random.seed(SCHEDULE_SEED)
-MOCK_SCHEDULE = _generate_schedule()
+MOCK_SCHEDULE_DAY_NAMES, MOCK_SCHEDULE_TIMES = _generate_schedule()
+# Same schedule as hashed sets, for preferred-time membership checks
+MOCK_SCHEDULE_SET: dict[str, frozenset[str]] = {
+    date: frozenset(times) for date, times in MOCK_SCHEDULE_TIMES.items()
+}
+# The schedule never changes after import, so sort it once
+MOCK_SCHEDULE_SORTED: list[tuple[str, tuple[str, ...]]] = sorted(MOCK_SCHEDULE_TIMES.items())
+# The combined per-date view, for callers of the original public name.
+# Lookups read the tables above, so changes to it are not seen by them.
+MOCK_SCHEDULE: dict[str, dict] = {
+    date: {"day_name": MOCK_SCHEDULE_DAY_NAMES[date], "times": list(times)}
+    for date, times in MOCK_SCHEDULE_TIMES.items()
+}
 
 
 def check_availability(
@@ -89,10 +105,10 @@ def check_availability(
     Returns a structured dict with availability status, available slots,
     and next-available fallback when the requested date is unavailable.
     """
-    techs = TECHNICIANS.get(service_type, TECHNICIANS["general handyman"])
+    techs = TECHNICIANS.get(service_type, _DEFAULT_TECHNICIANS)
 
-    if date not in MOCK_SCHEDULE:
-        next_date = _find_next_available()
+    if date not in MOCK_SCHEDULE_TIMES:
+        next_date = MOCK_NEXT_AVAILABLE
         return {
             "available": False,
             "slots": [],
@@ -100,9 +116,9 @@ def check_availability(
             "message": f"No availability on {date}.",
         }
 
-    day_data = MOCK_SCHEDULE[date]
+    times = MOCK_SCHEDULE_TIMES[date]
 
-    if preferred_time and preferred_time in day_data["times"]:
+    if preferred_time and preferred_time in MOCK_SCHEDULE_SET[date]:
         tech = random.choice(techs)
         return {
             "available": True,
@@ -111,10 +127,11 @@ def check_availability(
             "message": f"Available on {date} at {preferred_time} with {tech}.",
         }
 
-    if day_data["times"]:
+    if times:
+        choose = random.choice
         slots: list[TimeSlot] = [
-            {"time": t, "technician": random.choice(techs), "date": date}
-            for t in day_data["times"][:MAX_SLOTS_RETURNED]
+            {"time": t, "technician": choose(techs), "date": date}
+            for t in times[:MAX_SLOTS_RETURNED]
         ]
         return {
             "available": True,
@@ -123,7 +140,7 @@ def check_availability(
             "message": f"{len(slots)} time slots available on {date}.",
         }
 
-    next_date = _find_next_available()
+    next_date = MOCK_NEXT_AVAILABLE
     return {
         "available": False,
         "slots": [],
@@ -135,13 +152,13 @@ def check_availability(
 def get_available_dates(service_type: str, limit: int = 5) -> list[DateAvailability]:
     """Get the next N dates with available slots."""
     results: list[DateAvailability] = []
-    for date_str, day_data in sorted(MOCK_SCHEDULE.items()):
-        if day_data["times"]:
+    for date_str, times in MOCK_SCHEDULE_SORTED:
+        if times:
             results.append(
                 {
                     "date": date_str,
-                    "day_name": day_data["day_name"],
-                    "slot_count": len(day_data["times"]),
+                    "day_name": MOCK_SCHEDULE_DAY_NAMES[date_str],
+                    "slot_count": len(times),
                 }
             )
         if len(results) >= limit:
@@ -150,12 +167,16 @@ def get_available_dates(service_type: str, limit: int = 5) -> list[DateAvailabil
 
 
 def _find_next_available() -> Optional[str]:
-    for date_str, day_data in sorted(MOCK_SCHEDULE.items()):
-        if day_data["times"]:
-            return f"{date_str} {day_data['times'][0]}"
+    for date_str, times in MOCK_SCHEDULE_SORTED:
+        if times:
+            return f"{date_str} {times[0]}"
     return None
 
 
+# First open slot in the schedule, the fallback offered for unavailable dates
+MOCK_NEXT_AVAILABLE = _find_next_available()
+
+
 def reset() -> None:
     """Re-seed random state for deterministic tests."""
     random.seed(SCHEDULE_SEED)
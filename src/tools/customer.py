@@ -8,7 +8,7 @@ ServiceTitan customer records) to identify returning callers.
 from typing import Optional, TypedDict, cast
 
 from src.logging_context import get_call_logger
-from src.utils import normalize_phone
+from src.utils import canonical_phone
 
 logger = get_call_logger(__name__)
 
@@ -49,10 +49,7 @@ _customers: dict[str, CustomerRecord] = {
 
 def lookup_customer(phone: str) -> Optional[CustomerRecord]:
     """Look up a customer by phone number. Returns None if not found."""
-    cleaned = normalize_phone(phone)
-    if cleaned.startswith("+61"):
-        cleaned = "0" + cleaned[3:]
-    result = _customers.get(cleaned)
+    result = _customers.get(canonical_phone(phone))
     if result:
         logger.debug("Returning customer found: %s", result["name"])
     return result
@@ -62,7 +59,7 @@ def create_customer(
     name: str, phone: str, email: Optional[str] = None, address: Optional[str] = None
 ) -> CustomerRecord:
     """Create a new customer record."""
-    cleaned = normalize_phone(phone)
+    cleaned = canonical_phone(phone)
     customer: CustomerRecord = {
         "name": name,
         "phone": cleaned,
@@ -1,6 +1,7 @@
 """Service catalog with pricing, durations, and descriptions."""
 
 import logging
+import re
 from typing import Optional, TypedDict
 
 logger = logging.getLogger(__name__)
@@ -123,29 +124,74 @@ SERVICE_ALIASES: dict[str, str] = {
 }
 
 
-def get_valid_service_terms() -> list[str]:
+_VALID_SERVICE_TERMS: tuple[str, ...] = (*SERVICE_CATALOG, *SERVICE_ALIASES)
+
+
+def get_valid_service_terms() -> tuple[str, ...]:
     """Return all recognized service terms (catalog IDs + alias keys).
 
     This is the single source of truth for service validation across
     slot_manager, guardrails, and any other module that needs to check
-    whether a user query refers to a valid service.
+    whether a user query refers to a valid service. The catalog and
+    aliases are fixed at import, so the same tuple is returned each call.
+    """
+    return _VALID_SERVICE_TERMS
+
+
+# A query is a valid service term when it contains a term or is part of one
+_VALID_TERM_SUBSTRINGS = frozenset(
+    term[start:end]
+    for term in _VALID_SERVICE_TERMS
+    for start in range(len(term) + 1)
+    for end in range(start, len(term) + 1)
+)
+_VALID_TERM_RE = re.compile("|".join(re.escape(term) for term in _VALID_SERVICE_TERMS))
+
+
+def is_valid_service_term(query: str) -> bool:
+    """Return True if the query contains, or is part of, a recognized service term."""
+    normalized = query.lower().strip()
+    return normalized in _VALID_TERM_SUBSTRINGS or _VALID_TERM_RE.search(normalized) is not None
+
+
+def _index_catalog_substrings() -> dict[str, str]:
+    """Map every substring of every catalog ID to the first ID containing it.
+
+    No ID contains another, so this probe and the "ID is part of the
+    query" scan in match_service never disagree about catalog order.
     """
-    return list(SERVICE_CATALOG.keys()) + list(SERVICE_ALIASES.keys())
+    index: dict[str, str] = {}
+    for sid in SERVICE_CATALOG:
+        for start in range(len(sid) + 1):
+            for end in range(start, len(sid) + 1):
+                index.setdefault(sid[start:end], sid)
+    return index
+
+
+_CATALOG_ID_BY_SUBSTRING = _index_catalog_substrings()
+
+
+_SERVICE_SUMMARIES: tuple[ServiceSummary, ...] = tuple(
+    {"id": sid, "name": info["name"], "price_range": info["price_range"]}
+    for sid, info in SERVICE_CATALOG.items()
+)
 
 
 def get_all_services() -> list[ServiceSummary]:
     """Return all services with basic info."""
-    return [
-        {"id": sid, "name": info["name"], "price_range": info["price_range"]}
-        for sid, info in SERVICE_CATALOG.items()
-    ]
+    # Shallow copies, so callers can't alter the shared summaries
+    return [summary.copy() for summary in _SERVICE_SUMMARIES]
 
 
 def get_service_details(service_id: str) -> Optional[ServiceDetail]:
     """Get full details for a specific service."""
     normalized = service_id.lower().strip()
+    # Exact IDs and partial names are both keys of the substring index
+    sid = _CATALOG_ID_BY_SUBSTRING.get(normalized)
+    if sid is not None:
+        return {"id": sid, **SERVICE_CATALOG[sid]}
     for sid, info in SERVICE_CATALOG.items():
-        if sid == normalized or normalized in sid or sid in normalized:
+        if sid in normalized:
             return {"id": sid, **info}
     return None
 
@@ -156,7 +202,10 @@ def match_service(query: str) -> Optional[str]:
     for alias, service_id in SERVICE_ALIASES.items():
         if alias in normalized:
             return service_id
+    sid = _CATALOG_ID_BY_SUBSTRING.get(normalized)
+    if sid is not None:
+        return sid
     for sid in SERVICE_CATALOG:
-        if sid in normalized or normalized in sid:
+        if sid in normalized:
             return sid
     return None
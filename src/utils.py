@@ -1,6 +1,18 @@
 """Shared utilities used across the voice agent orchestrator."""
 
-import re
+
+def _strip_non_digits(value: str) -> str:
+    if value.isdecimal():
+        return value
+    # Drop the separators callers usually type; each replace is a C-level
+    # scan, much cheaper on short strings than str.translate's per-char
+    # table lookups. Anything else left falls back to a digit filter.
+    digits = (
+        value.replace(" ", "").replace("-", "").replace("(", "").replace(")", "").replace(".", "")
+    )
+    if not digits.isdecimal():
+        digits = "".join(filter(str.isdecimal, digits))
+    return digits
 
 
 def normalize_phone(value: str) -> str:
@@ -14,5 +26,24 @@ def normalize_phone(value: str) -> str:
     """
     value = value.strip()
     if value.startswith("+"):
-        return "+" + re.sub(r"[^\d]", "", value[1:])
-    return re.sub(r"[^\d]", "", value)
+        return "+" + _strip_non_digits(value[1:])
+    return _strip_non_digits(value)
+
+
+def canonical_phone(value: str) -> str:
+    """Normalize a phone number to Australian local form (+61 becomes 0).
+
+    Examples:
+        >>> canonical_phone("+61 (412) 345-678")
+        '0412345678'
+        >>> canonical_phone("0412 345 678")
+        '0412345678'
+    """
+    value = value.strip()
+    if value.startswith("+61"):
+        # Rewrite the prefix while stripping, instead of slicing the result
+        return "0" + _strip_non_digits(value[3:])
+    cleaned = normalize_phone(value)
+    if cleaned.startswith("+61"):  # e.g. "+ 61 ..."
+        return "0" + cleaned[3:]
+    return cleaned
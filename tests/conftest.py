@@ -1,13 +1,15 @@
 """Shared test fixtures and helpers."""
 
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import pytest
 
 from src.conversation.guardrails import GuardrailPipeline
 from src.conversation.slot_manager import SlotManager
-from src.conversation.state_machine import ConversationStateMachine
+from src.conversation.state_machine import ConversationStateMachine, TransitionTrigger
+from src.evaluation.transcript_analyzer import TranscriptAnalyzer
 from src.schemas.conversation_schema import (
     CallOutcome,
     ConversationTranscript,
@@ -25,16 +27,63 @@ def _reset_tool_state():
     availability.reset()
 
 
+@pytest.fixture(scope="session")
+def sample_transcripts() -> list[ConversationTranscript]:
+    """Transcripts from sample_transcripts/, loaded once per test session.
+
+    Tests must not modify them.
+    """
+    sample_dir = Path("sample_transcripts")
+    if not sample_dir.exists():
+        pytest.skip("sample_transcripts directory not found")
+    return TranscriptAnalyzer().load_directory(sample_dir)
+
+
 @pytest.fixture
 def state_machine():
     return ConversationStateMachine()
 
 
+@pytest.fixture
+def sm_after_greeting(state_machine):
+    """State machine waiting in INTENT_DETECTION."""
+    state_machine.transition(TransitionTrigger.GREETING_DELIVERED)
+    return state_machine
+
+
+@pytest.fixture
+def sm_at_slot_filling(sm_after_greeting):
+    """State machine that has started collecting booking slots."""
+    sm_after_greeting.transition(TransitionTrigger.INTENT_BOOK)
+    sm_after_greeting.transition(TransitionTrigger.SERVICE_CONFIRMED)
+    return sm_after_greeting
+
+
+@pytest.fixture
+def sm_at_availability_check(sm_at_slot_filling):
+    """State machine whose caller has confirmed all booking details."""
+    sm_at_slot_filling.transition(TransitionTrigger.ALL_SLOTS_FILLED)
+    sm_at_slot_filling.transition(TransitionTrigger.CALLER_CONFIRMED)
+    return sm_at_slot_filling
+
+
 @pytest.fixture
 def slot_manager():
     return SlotManager()
 
 
+@pytest.fixture
+def filled_slot_manager(slot_manager):
+    """A SlotManager with every required slot set to a valid value."""
+    slot_manager.set_slot("customer_name", "John Smith")
+    slot_manager.set_slot("customer_phone", "0412345678")
+    slot_manager.set_slot("service_type", "plumbing")
+    slot_manager.set_slot("preferred_date", "2025-03-18")
+    slot_manager.set_slot("preferred_time", "10:00")
+    slot_manager.set_slot("customer_address", "42 Oak Avenue, Richmond VIC 3121")
+    return slot_manager
+
+
 @pytest.fixture
 def guardrail_pipeline():
     return GuardrailPipeline()
@@ -59,6 +108,14 @@ def make_turn(
     )
 
 
+# Default conversation shared by make_transcript; no test mutates turns
+_DEFAULT_TURNS = (
+    make_turn(Speaker.AGENT, "Hello, how can I help?", 0.0, "IntakeAgent"),
+    make_turn(Speaker.USER, "I need to book a plumber.", 3.0),
+    make_turn(Speaker.AGENT, "Let me help with that.", 5.0, "BookingAgent"),
+)
+
+
 def make_transcript(
     call_id: str = "TEST-001",
     outcome: CallOutcome = CallOutcome.BOOKING_MADE,
@@ -71,11 +128,7 @@ def make_transcript(
 ) -> ConversationTranscript:
     """Helper to create a ConversationTranscript with sensible defaults."""
     if turns is None:
-        turns = [
-            make_turn(Speaker.AGENT, "Hello, how can I help?", 0.0, "IntakeAgent"),
-            make_turn(Speaker.USER, "I need to book a plumber.", 3.0),
-            make_turn(Speaker.AGENT, "Let me help with that.", 5.0, "BookingAgent"),
-        ]
+        turns = list(_DEFAULT_TURNS)
     return ConversationTranscript(
         call_id=call_id,
         timestamp=datetime(2025, 3, 15, 10, 0),
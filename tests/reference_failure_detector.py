@@ -0,0 +1,268 @@
+"""Reference failure detector for equivalence tests.
+
+A straightforward port of the original detector: one word-boundary regex
+per phrase table and one pass over the turns per pattern. The production
+:class:`~src.evaluation.failure_detector.FailureDetector` scans every turn
+once with a combined trie regex and must report exactly the same failures.
+Keep the phrase lists in sync with ``src/evaluation/failure_detector.py``.
+"""
+
+import re
+from typing import Optional
+
+from src.config import settings
+from src.evaluation.failure_detector import (
+    CONFIRMATION_LOOP_THRESHOLD,
+    INCOMPLETE_BOOKING_MIN_SLOTS,
+    MAX_REASONABLE_AGENTS,
+    REPEATED_SLOT_THRESHOLD,
+    TOTAL_REQUIRED_SLOTS,
+    FailurePattern,
+    FailureSeverity,
+)
+from src.schemas.conversation_schema import CallOutcome, ConversationTranscript, Speaker
+
+# (pattern, severity, evidence, turn_index, recommendation)
+ReferenceFailure = tuple[FailurePattern, FailureSeverity, str, Optional[int], str]
+
+
+def _compile(phrases: list[str]) -> re.Pattern[str]:
+    escaped = [re.escape(p) for p in phrases]
+    return re.compile(r"\b(?:" + "|".join(escaped) + r")\b", re.IGNORECASE)
+
+
+SLOT_KEYWORDS = ["name", "phone", "number", "address", "date", "time", "service"]
+SLOT_QUESTION_WORDS = ["what", "could", "can you"]
+CONFIRMATION_PHRASES = ["does everything sound correct", "let me confirm", "here's what i have"]
+OUT_OF_SCOPE_TOPICS = [
+    "medical",
+    "legal advice",
+    "financial advice",
+    "competitor",
+    "political",
+    "investment",
+    "cryptocurrency",
+]
+SCOPE_DEFLECTIONS = ["i can't help with", "outside"]
+FRUSTRATION_PHRASES = [
+    "i already told you",
+    "this is ridiculous",
+    "useless",
+    "speak to a person",
+    "real person",
+    "manager",
+    "supervisor",
+    "worst service",
+    "unacceptable",
+]
+ESCALATION_RESPONSES = ["transfer", "connect", "apologize", "sorry"]
+HALLUCINATION_CLAIMS = [
+    "guarantee",
+    "warranty",
+    "award-winning",
+    "best in the city",
+    "cheapest",
+    "lowest price",
+    "fully insured",
+    "fully licensed",
+]
+BOOKING_SIGNALS = ["book", "appointment", "schedule", "come out", "send someone"]
+INFO_SIGNALS = ["how much", "price", "cost", "what services", "do you offer"]
+BOOKING_RESPONSES = ["book", "name", "appointment", "schedule"]
+INFO_RESPONSES = ["price", "service", "cost", "offer"]
+USER_ESCALATION_PHRASES = ["manager", "supervisor", "human", "real person", "speak to"]
+
+ALL_PHRASES = sorted(
+    {
+        phrase
+        for table in (
+            SLOT_KEYWORDS,
+            SLOT_QUESTION_WORDS,
+            CONFIRMATION_PHRASES,
+            OUT_OF_SCOPE_TOPICS,
+            SCOPE_DEFLECTIONS,
+            FRUSTRATION_PHRASES,
+            ESCALATION_RESPONSES,
+            HALLUCINATION_CLAIMS,
+            BOOKING_SIGNALS,
+            INFO_SIGNALS,
+            BOOKING_RESPONSES,
+            INFO_RESPONSES,
+            USER_ESCALATION_PHRASES,
+        )
+        for phrase in table
+    }
+)
+
+_SLOT_KW_RE = _compile(SLOT_KEYWORDS)
+_SLOT_Q_RE = _compile(SLOT_QUESTION_WORDS)
+_CONFIRMATION_RE = _compile(CONFIRMATION_PHRASES)
+_OUT_OF_SCOPE_RE = _compile(OUT_OF_SCOPE_TOPICS)
+_SCOPE_DEFLECTION_RE = _compile(SCOPE_DEFLECTIONS)
+_FRUSTRATION_RE = _compile(FRUSTRATION_PHRASES)
+_ESCALATION_RESPONSE_RE = _compile(ESCALATION_RESPONSES)
+_HALLUCINATION_RE = _compile(HALLUCINATION_CLAIMS)
+_BOOKING_RE = _compile(BOOKING_SIGNALS)
+_INFO_RE = _compile(INFO_SIGNALS)
+_BOOKING_RESPONSE_RE = _compile(BOOKING_RESPONSES)
+_INFO_RESPONSE_RE = _compile(INFO_RESPONSES)
+_USER_ESCALATION_RE = _compile(USER_ESCALATION_PHRASES)
+
+
+def _next_agent_text(transcript: ConversationTranscript, i: int) -> Optional[str]:
+    """Text of the first agent turn among the two turns after turn ``i``."""
+    turns = transcript.turns
+    for j in range(i + 1, min(i + 3, len(turns))):
+        if turns[j].speaker == Speaker.AGENT:
+            return turns[j].text
+    return None
+
+
+def detect_all(transcript: ConversationTranscript) -> list[ReferenceFailure]:
+    """Return every failure in ``transcript``, grouped in ``FailurePattern`` order."""
+    failures: list[ReferenceFailure] = []
+    turns = transcript.turns
+    agent_turns = [(i, t.text) for i, t in enumerate(turns) if t.speaker == Speaker.AGENT]
+    user_turns = [(i, t.text) for i, t in enumerate(turns) if t.speaker == Speaker.USER]
+
+    slot_questions: dict[str, list[int]] = {}
+    for i, text in agent_turns:
+        if _SLOT_Q_RE.search(text):
+            for match in _SLOT_KW_RE.finditer(text):
+                slot_questions.setdefault(match.group().lower(), []).append(i)
+    for slot, indices in slot_questions.items():
+        if len(indices) >= REPEATED_SLOT_THRESHOLD:
+            failures.append((
+                FailurePattern.REPEATED_SLOT_FAILURE,
+                FailureSeverity.HIGH,
+                f"Agent asked for '{slot}' {len(indices)} times (turns {indices})",
+                indices[-1],
+                f"Improve {slot} slot extraction — add normalization or clarification prompts.",
+            ))
+
+    confirmations = 0
+    for i, text in agent_turns:
+        if _CONFIRMATION_RE.search(text):
+            confirmations += 1
+            if confirmations >= CONFIRMATION_LOOP_THRESHOLD:
+                failures.append((
+                    FailurePattern.CONFIRMATION_LOOP,
+                    FailureSeverity.MEDIUM,
+                    f"Confirmation read-back repeated {confirmations} times",
+                    i,
+                    "Add logic to detect repeated confirmations"
+                    " and offer to correct specific fields.",
+                ))
+
+    agents_used = transcript.agents_used or []
+    if len(agents_used) > MAX_REASONABLE_AGENTS:
+        failures.append((
+            FailurePattern.WRONG_AGENT_HANDOFF,
+            FailureSeverity.MEDIUM,
+            f"Caller passed through {len(agents_used)} agents: {agents_used}",
+            None,
+            "Review intent detection to reduce unnecessary handoffs.",
+        ))
+
+    for i, text in agent_turns:
+        if _SCOPE_DEFLECTION_RE.search(text):
+            continue
+        for match in _OUT_OF_SCOPE_RE.finditer(text):
+            topic = match.group().lower()
+            failures.append((
+                FailurePattern.SCOPE_VIOLATION,
+                FailureSeverity.HIGH,
+                f"Agent response contains out-of-scope topic '{topic}' at turn {i}",
+                i,
+                f"Add scope guardrail for '{topic}' topic.",
+            ))
+
+    for i, text in user_turns:
+        match = _FRUSTRATION_RE.search(text)
+        if not match:
+            continue
+        reply = _next_agent_text(transcript, i)
+        if reply is None or not _ESCALATION_RESPONSE_RE.search(reply):
+            failures.append((
+                FailurePattern.CALLER_FRUSTRATION,
+                FailureSeverity.CRITICAL,
+                f"Caller frustration ('{match.group().lower()}') at turn {i} not addressed",
+                i,
+                "Add frustration detection in guardrails and auto-escalate.",
+            ))
+
+    for i, text in agent_turns:
+        for match in _HALLUCINATION_RE.finditer(text):
+            claim = match.group().lower()
+            failures.append((
+                FailurePattern.HALLUCINATED_INFO,
+                FailureSeverity.HIGH,
+                f"Agent used unverified claim '{claim}' at turn {i}",
+                i,
+                f"Add post-LLM guardrail to block '{claim}' claims.",
+            ))
+
+    for i, text in user_turns:
+        booking = bool(_BOOKING_RE.search(text))
+        info = bool(_INFO_RE.search(text))
+        if not (booking or info):
+            continue
+        reply = _next_agent_text(transcript, i)
+        addressed = reply is not None and (
+            (booking and bool(_BOOKING_RESPONSE_RE.search(reply)))
+            or (info and bool(_INFO_RESPONSE_RE.search(reply)))
+        )
+        if not addressed and i < len(turns) - 2:
+            intent = "booking" if booking else "info"
+            failures.append((
+                FailurePattern.MISSED_INTENT,
+                FailureSeverity.HIGH,
+                f"Caller expressed {intent} intent at turn {i}"
+                " but agent didn't respond appropriately",
+                i,
+                f"Improve intent detection for {intent} keywords.",
+            ))
+
+    filled = sum(1 for v in (transcript.slots_collected or {}).values() if v)
+    if filled >= INCOMPLETE_BOOKING_MIN_SLOTS and transcript.outcome not in (
+        CallOutcome.BOOKING_MADE,
+        CallOutcome.ESCALATED,
+    ):
+        failures.append((
+            FailurePattern.INCOMPLETE_BOOKING,
+            FailureSeverity.HIGH,
+            f"Booking had {filled}/{TOTAL_REQUIRED_SLOTS} slots filled"
+            f" but ended as {transcript.outcome.value}",
+            None,
+            "Review why booking was not completed — possible conversation flow issue.",
+        ))
+
+    if transcript.outcome == CallOutcome.ESCALATED:
+        user_requested = any(_USER_ESCALATION_RE.search(text) for _, text in user_turns)
+        if (
+            not user_requested
+            and transcript.error_count < settings.guardrails.confusion_threshold
+        ):
+            failures.append((
+                FailurePattern.UNNECESSARY_ESCALATION,
+                FailureSeverity.MEDIUM,
+                f"Call escalated with only {transcript.error_count} errors"
+                " and no user request for human",
+                None,
+                "Review escalation triggers — threshold may be too sensitive.",
+            ))
+
+    threshold = settings.guardrails.slow_response_threshold_sec
+    for i, turn in enumerate(turns):
+        if turn.speaker == Speaker.AGENT and turn.response_time_ms:
+            response_sec = turn.response_time_ms / 1000
+            if response_sec > threshold:
+                failures.append((
+                    FailurePattern.SLOW_RESPONSE,
+                    FailureSeverity.LOW,
+                    f"Response at turn {i} took {response_sec:.1f}s (threshold: {threshold}s)",
+                    i,
+                    "Optimize tool calls or reduce prompt complexity for faster responses.",
+                ))
+
+    return failures
@@ -7,10 +7,10 @@ from src.conversation.state_machine import (
     ConversationStateMachine,
     TransitionTrigger,
 )
-from src.tools.availability import check_availability, get_available_dates
+from src.tools.availability import MOCK_SCHEDULE, check_availability, get_available_dates
 from src.tools.booking import cancel_booking, create_booking, get_booking, reschedule_booking
 from src.tools.customer import create_customer, lookup_customer
-from src.tools.services import get_service_details, match_service
+from src.tools.services import get_service_details, is_valid_service_term, match_service
 
 
 class TestFullBookingFlow:
@@ -126,12 +126,22 @@ class TestServiceTools:
     def test_match_service_unknown(self):
         assert match_service("landscaping") is None
 
+    def test_valid_service_term_containment(self):
+        assert is_valid_service_term("I need an Electrician")
+        assert is_valid_service_term("drain")  # part of "drain cleaning"
+        assert not is_valid_service_term("landscaping")
+
     def test_get_service_details_found(self):
         details = get_service_details("plumbing")
         assert details is not None
         assert details["name"] == "Plumbing Service"
         assert "$" in details["price_range"]
 
+    def test_get_service_details_partial_name(self):
+        details = get_service_details("Drain")
+        assert details is not None
+        assert details["id"] == "drain cleaning"
+
     def test_get_service_details_not_found(self):
         details = get_service_details("landscaping")
         assert details is None
@@ -226,6 +236,22 @@ class TestCustomerTools:
         assert found is not None
         assert found["name"] == "New Person"
 
+    def test_create_customer_international_format(self):
+        customer = create_customer("New Person", "+61 499 888 777")
+        assert customer["phone"] == "0499888777"
+
+        found = lookup_customer("0499 888 777")
+        assert found is not None
+        assert found["name"] == "New Person"
+
+    def test_create_customer_local_format_found_by_international(self):
+        customer = create_customer("New Person", "0499 888 777")
+        assert customer["phone"] == "0499888777"
+
+        found = lookup_customer("+61 499 888 777")
+        assert found is not None
+        assert found["phone"] == "0499888777"
+
 
 class TestAvailabilityTools:
     def test_get_available_dates(self):
@@ -237,3 +263,19 @@ class TestAvailabilityTools:
         result = check_availability("plumbing", "1999-01-01")
         assert result["available"] is False
         assert result["next_available"] is not None
+
+    def test_check_availability_preferred_time(self):
+        date = get_available_dates("plumbing", limit=1)[0]["date"]
+        first_slot = check_availability("plumbing", date)["slots"][0]["time"]
+        result = check_availability("plumbing", date, first_slot)
+        assert result["available"] is True
+        assert [s["time"] for s in result["slots"]] == [first_slot]
+
+    def test_mock_schedule_keeps_original_shape(self):
+        first = get_available_dates("plumbing", limit=1)[0]
+        date = first["date"]
+        day = MOCK_SCHEDULE[date]
+        assert isinstance(day["times"], list)
+        assert day["day_name"] == first["day_name"]
+        slots = check_availability("plumbing", date)["slots"]
+        assert [s["time"] for s in slots] == day["times"][: len(slots)]
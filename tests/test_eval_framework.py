@@ -1,19 +1,81 @@
 """Tests for the evaluation framework: metrics, failure detection, and auto-improver."""
 
+import random
 from pathlib import Path
 
 import pytest
 
 from src.evaluation.auto_improver import AutoImprover
-from src.evaluation.failure_detector import FailureDetector, FailurePattern, FailureSeverity
+from src.evaluation.failure_detector import (
+    DetectedFailure,
+    DetectedFailureBatch,
+    FailureDetector,
+    FailurePattern,
+    FailureSeverity,
+)
 from src.evaluation.metrics import EvalMetrics, MetricsCalculator
 from src.evaluation.transcript_analyzer import TranscriptAnalyzer
 from src.schemas.conversation_schema import (
     CallOutcome,
     Speaker,
 )
+from tests import reference_failure_detector
 from tests.conftest import make_transcript, make_transcript_with_turns, make_turn
 
+# Words around the phrases in random transcripts: plain filler, words that
+# contain a phrase without word boundaries, and non-ASCII text
+_FILLER_WORDS = ["the", "a", "please", "okay", "booking", "named", "costs", "café", "über"]
+# Non-ASCII characters that match ASCII letters case-insensitively
+_CASE_FOLDS = {"i": "İ", "k": "\u212a", "s": "\u017f"}
+_SEPARATORS = [" ", " ", ", ", ". ", "-", ""]
+
+
+def _random_text(rng: random.Random, phrases: list[str]) -> str:
+    words = []
+    for _ in range(rng.randint(0, 8)):
+        if rng.random() < 0.6:
+            word = rng.choice(phrases)
+        else:
+            word = rng.choice(_FILLER_WORDS)
+        case = rng.random()
+        if case < 0.2:
+            word = word.upper()
+        elif case < 0.4:
+            word = word.title()
+        elif case < 0.45:
+            word = "".join(_CASE_FOLDS.get(char, char) for char in word)
+        words.append(word)
+        words.append(rng.choice(_SEPARATORS))
+    return "".join(words)
+
+
+def _random_transcript(rng: random.Random):
+    # A few phrases per transcript, so that repeated-phrase patterns occur
+    phrases = rng.sample(reference_failure_detector.ALL_PHRASES, 5)
+    turns = [
+        make_turn(
+            rng.choice([Speaker.AGENT, Speaker.USER, Speaker.SYSTEM]),
+            _random_text(rng, phrases),
+            float(i),
+            response_time_ms=rng.choice([None, 0, 800, 8000, 8001, 12000]),
+        )
+        for i in range(rng.randint(0, 10))
+    ]
+    slot_names = [
+        "customer_name",
+        "customer_phone",
+        "service_type",
+        "preferred_date",
+        "preferred_time",
+    ]
+    return make_transcript(
+        turns=turns,
+        outcome=rng.choice(list(CallOutcome)),
+        slots={name: rng.choice(["", "x"]) for name in rng.sample(slot_names, rng.randint(0, 5))},
+        agents_used=[f"Agent{n}" for n in range(rng.randint(1, 5))],
+        error_count=rng.randint(0, 4),
+    )
+
 
 class TestMetricsCalculator:
     def setup_method(self):
@@ -80,6 +142,13 @@ class TestMetricsCalculator:
         metrics = self.calc.calculate_batch([])
         assert metrics.success_rate == 0.0
 
+    def test_rescoring_reflects_changed_transcript(self):
+        transcript = make_transcript(error_count=0)
+        first = self.calc.calculate(transcript)
+        transcript.error_count = 3
+        assert self.calc.calculate(transcript).error_rate == pytest.approx(1.0)
+        assert first.error_rate == 0.0
+
 
 class TestFailureDetector:
     def setup_method(self):
@@ -100,6 +169,15 @@ class TestFailureDetector:
         pattern_types = [f.pattern for f in failures]
         assert FailurePattern.REPEATED_SLOT_FAILURE in pattern_types
 
+    def test_redetection_reflects_changed_transcript(self):
+        transcript = make_transcript_with_turns([("agent", "What is your name?")])
+        assert self.detector.detect_all(transcript) == []
+        transcript.turns.extend(
+            make_turn(Speaker.AGENT, "Could you tell me your name again?") for _ in range(2)
+        )
+        pattern_types = [f.pattern for f in self.detector.detect_all(transcript)]
+        assert FailurePattern.REPEATED_SLOT_FAILURE in pattern_types
+
     def test_detect_confirmation_loop(self):
         turns = [
             ("agent", "Here's what I have. Does everything sound correct?"),
@@ -136,6 +214,74 @@ class TestFailureDetector:
         ]
         assert len(frustration_failures) == 0
 
+    def test_frustration_response_window_is_two_turns(self):
+        within = make_transcript_with_turns([
+            ("user", "This is ridiculous"),
+            ("user", "Hello?"),
+            ("agent", "Sorry, let me transfer you."),
+        ])
+        beyond = make_transcript_with_turns([
+            ("user", "This is ridiculous"),
+            ("user", "Hello?"),
+            ("user", "Anyone?"),
+            ("agent", "Sorry, let me transfer you."),
+        ])
+        for transcript, expected in ((within, 0), (beyond, 1)):
+            failures = self.detector.detect_all(transcript)
+            frustration = [f for f in failures if f.pattern == FailurePattern.CALLER_FRUSTRATION]
+            assert len(frustration) == expected
+
+    def test_overlapping_phrases_match_every_category(self):
+        turns = [
+            ("user", "Let me speak to a person please"),
+            ("agent", "One moment."),
+        ]
+        transcript = make_transcript_with_turns(turns, outcome=CallOutcome.ESCALATED)
+        failures = self.detector.detect_all(transcript)
+        frustration = [f for f in failures if f.pattern == FailurePattern.CALLER_FRUSTRATION]
+        assert len(frustration) == 1
+        assert "'speak to a person'" in frustration[0].evidence
+        # "speak to" inside the longer phrase still counts as an escalation request
+        assert FailurePattern.UNNECESSARY_ESCALATION not in [f.pattern for f in failures]
+
+    def test_phrase_inside_longer_phrase_still_matches(self):
+        # "what" inside "here's what i have" still marks a slot question
+        turns = [("agent", "Here's what I have: your name is Sam.")] * 3
+        transcript = make_transcript_with_turns(turns)
+        patterns = [f.pattern for f in self.detector.detect_all(transcript)]
+        assert FailurePattern.REPEATED_SLOT_FAILURE in patterns
+        assert FailurePattern.CONFIRMATION_LOOP in patterns
+
+    def test_matches_reference_detector_on_random_transcripts(self):
+        rng = random.Random(20250315)
+        for _ in range(500):
+            transcript = _random_transcript(rng)
+            actual = [
+                (f.pattern, f.severity, f.evidence, f.turn_index, f.recommendation)
+                for f in self.detector.detect_all(transcript)
+            ]
+            assert actual == reference_failure_detector.detect_all(transcript), transcript
+
+    @pytest.mark.parametrize(
+        ("text", "claims"),
+        [
+            ("We are the CHEAPEST in town", ["cheapest"]),
+            ("Café prices: the Cheapest around", ["cheapest"]),
+            ("We GUARANTEE it, and we're the Cheapest", ["guarantee", "cheapest"]),
+            # Lowercasing "İ" yields "i" plus a combining dot, a word boundary
+            # that isn't in the original text
+            ("İCheapest", []),
+        ],
+    )
+    def test_phrases_match_case_insensitively(self, text, claims):
+        transcript = make_transcript_with_turns([("agent", text)])
+        evidence = [
+            f.evidence
+            for f in self.detector.detect_all(transcript)
+            if f.pattern == FailurePattern.HALLUCINATED_INFO
+        ]
+        assert evidence == [f"Agent used unverified claim '{claim}' at turn 0" for claim in claims]
+
     def test_detect_hallucinated_info(self):
         turns = [
             ("agent", "We guarantee all our work for 10 years."),
@@ -168,6 +314,12 @@ class TestFailureDetector:
         pattern_types = [f.pattern for f in failures]
         assert FailurePattern.WRONG_AGENT_HANDOFF in pattern_types
 
+    def test_handoff_evidence_ignores_later_agent_changes(self):
+        transcript = make_transcript(agents_used=["A", "B", "C", "D"])
+        (failure,) = self.detector.detect_all(transcript)
+        transcript.agents_used.append("E")
+        assert failure.evidence == "Caller passed through 4 agents: ['A', 'B', 'C', 'D']"
+
     def test_detect_slow_response(self):
         turns = [
             make_turn(Speaker.AGENT, "Processing...", 0.0, response_time_ms=12000),
@@ -177,6 +329,47 @@ class TestFailureDetector:
         pattern_types = [f.pattern for f in failures]
         assert FailurePattern.SLOW_RESPONSE in pattern_types
 
+    def test_lazy_evidence_formatted_on_access(self):
+        failure = DetectedFailure._lazy(
+            pattern=FailurePattern.SCOPE_VIOLATION,
+            severity=FailureSeverity.HIGH,
+            evidence_fmt=("Topic '{}' at turn {}", ("medical", 2)),
+            turn_index=2,
+            recommendation_fmt=("Block '{}'.", ("medical",)),
+        )
+        assert failure.evidence == "Topic 'medical' at turn 2"
+        assert failure.recommendation == "Block 'medical'."
+        assert failure == DetectedFailure(
+            pattern=FailurePattern.SCOPE_VIOLATION,
+            severity=FailureSeverity.HIGH,
+            evidence="Topic 'medical' at turn 2",
+            turn_index=2,
+            recommendation="Block 'medical'.",
+        )
+
+    def test_detect_all_batch_columns(self):
+        turns = [
+            ("agent", "We guarantee the work and give a warranty."),
+            ("user", "Great!"),
+        ]
+        transcript = make_transcript_with_turns(
+            turns, agents_used=["IntakeAgent", "BookingAgent", "InfoAgent", "EscalationAgent"]
+        )
+        batch = self.detector.detect_all_batch(transcript)
+        assert len(batch) == 3
+        assert batch.count_by_pattern() == {
+            FailurePattern.HALLUCINATED_INFO: 2,
+            FailurePattern.WRONG_AGENT_HANDOFF: 1,
+        }
+        assert list(batch.turn_index) == [-1, 0, 0]
+        assert batch.to_failures() == self.detector.detect_all(transcript)
+
+        merged = DetectedFailureBatch.concat([batch, batch])
+        assert merged.count_by_severity() == {
+            FailureSeverity.HIGH: 4,
+            FailureSeverity.MEDIUM: 2,
+        }
+
     def test_no_failures_on_clean_transcript(self):
         turns = [
             make_turn(Speaker.AGENT, "Hello, how can I help?", 0.0, agent_id="IntakeAgent"),
@@ -198,8 +391,6 @@ class TestAutoImprover:
         self.improver = AutoImprover()
 
     def test_suggestions_generated_for_known_patterns(self):
-        from src.evaluation.failure_detector import DetectedFailure
-
         failures = [
             DetectedFailure(
                 pattern=FailurePattern.REPEATED_SLOT_FAILURE,
@@ -218,8 +409,6 @@ class TestAutoImprover:
         assert suggestions[0].priority == "critical"
 
     def test_deduplication_of_same_pattern(self):
-        from src.evaluation.failure_detector import DetectedFailure
-
         failures = [
             DetectedFailure(
                 pattern=FailurePattern.HALLUCINATED_INFO,
@@ -236,8 +425,6 @@ class TestAutoImprover:
         assert len(suggestions) == 1
 
     def test_format_suggestions_output(self):
-        from src.evaluation.failure_detector import DetectedFailure
-
         failures = [
             DetectedFailure(
                 pattern=FailurePattern.SCOPE_VIOLATION,
@@ -275,6 +462,17 @@ class TestTranscriptAnalyzer:
         assert report.total_calls == 2
         assert len(report.analyses) == 2
 
+    def test_parallel_batch_matches_serial(self):
+        transcripts = [
+            make_transcript(call_id=f"TEST-{i:03d}", outcome=outcome)
+            for i, outcome in enumerate(list(CallOutcome) * 2)
+        ]
+        serial = self.analyzer.analyze_batch(transcripts, workers=1)
+        parallel = TranscriptAnalyzer().analyze_batch(transcripts, workers=2)
+        assert self.analyzer.format_batch_report(parallel) == self.analyzer.format_batch_report(
+            serial
+        )
+
     def test_batch_report_formatting(self):
         t1 = make_transcript()
         report = self.analyzer.analyze_batch([t1])
@@ -282,28 +480,68 @@ class TestTranscriptAnalyzer:
         assert "ANALYZED: 1 conversations" in output
         assert "PER-CALL BREAKDOWN" in output
 
-    def test_load_from_sample_transcripts(self):
-        sample_dir = Path("sample_transcripts")
-        if sample_dir.exists():
-            transcripts = self.analyzer.load_directory(sample_dir)
-            assert len(transcripts) >= 1
-            report = self.analyzer.analyze_batch(transcripts)
-            assert report.total_calls == len(transcripts)
+    def test_load_from_sample_transcripts(self, sample_transcripts):
+        assert len(sample_transcripts) >= 1
+        report = self.analyzer.analyze_batch(sample_transcripts)
+        assert report.total_calls == len(sample_transcripts)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_analyze_directory_matches_batch(self, sample_transcripts, workers):
+        expected = self.analyzer.analyze_batch(sample_transcripts)
+        report = TranscriptAnalyzer().analyze_directory(Path("sample_transcripts"), workers=workers)
+        assert self.analyzer.format_batch_report(report) == self.analyzer.format_batch_report(
+            expected
+        )
+
+    def test_analyze_directory_skips_invalid_files(self, tmp_path):
+        sample = next(Path("sample_transcripts").glob("*.json"), None)
+        if sample is None:
+            pytest.skip("sample_transcripts directory not found")
+        (tmp_path / "good.json").write_text(sample.read_text(encoding="utf-8"), encoding="utf-8")
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+
+        report = self.analyzer.analyze_directory(tmp_path, workers=1)
+        assert report.total_calls == 1
+
+        with pytest.raises(ValueError):
+            self.analyzer.analyze_directory(tmp_path, workers=1, strict=True)
+
+    def test_load_directory_keeps_file_order(self, tmp_path):
+        sample = next(Path("sample_transcripts").glob("*.json"), None)
+        if sample is None:
+            pytest.skip("sample_transcripts directory not found")
+        template = self.analyzer.load_transcript(sample)
+        for i in range(12):
+            transcript = template.model_copy(update={"call_id": f"CALL-{i:02d}"})
+            (tmp_path / f"{i:02d}.json").write_text(transcript.model_dump_json(), encoding="utf-8")
+        (tmp_path / "05a.json").write_text("[]", encoding="utf-8")
+
+        transcripts = self.analyzer.load_directory(tmp_path)
+        assert [t.call_id for t in transcripts] == [f"CALL-{i:02d}" for i in range(12)]
+
+        with pytest.raises(ValueError):
+            self.analyzer.load_directory(tmp_path, strict=True)
+
+    def test_load_directory_ignores_non_json_entries(self, tmp_path):
+        sample = next(Path("sample_transcripts").glob("*.json"), None)
+        if sample is None:
+            pytest.skip("sample_transcripts directory not found")
+        (tmp_path / "call.json").write_text(sample.read_text(encoding="utf-8"), encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("not a transcript", encoding="utf-8")
+        (tmp_path / "archive.json").mkdir()
+
+        transcripts = self.analyzer.load_directory(tmp_path, strict=True)
+        assert len(transcripts) == 1
 
 
 class TestSampleTranscriptEval:
     """Run evaluation on actual sample transcripts."""
 
-    def test_eval_sample_transcripts(self):
+    def test_eval_sample_transcripts(self, sample_transcripts):
         analyzer = TranscriptAnalyzer()
-        sample_dir = Path("sample_transcripts")
-        if not sample_dir.exists():
-            pytest.skip("sample_transcripts directory not found")
-
-        transcripts = analyzer.load_directory(sample_dir)
-        assert len(transcripts) == 5
+        assert len(sample_transcripts) == 5
 
-        report = analyzer.analyze_batch(transcripts)
+        report = analyzer.analyze_batch(sample_transcripts)
         assert report.total_calls == 5
 
         # At least some should succeed
@@ -4,9 +4,30 @@ Ensures all public modules can be imported without errors and
 that re-exports from __init__.py files work correctly.
 """
 
+import importlib
+
 import pytest
 
 
+class TestPublicNames:
+    """Smoke-check names whose only contract here is being importable."""
+
+    @pytest.mark.parametrize(
+        ("module_name", "name"),
+        [
+            ("src.schemas.booking_schema", "BookingRequest"),
+            ("src.tools.availability", "check_availability"),
+            ("src.tools.booking", "create_booking"),
+            ("src.tools.customer", "lookup_customer"),
+            ("src.prompts.prompt_templates", "build_slot_collection_prompt"),
+            ("src.evaluation", "TranscriptAnalyzer"),
+        ],
+    )
+    def test_name_is_importable(self, module_name, name):
+        module = importlib.import_module(module_name)
+        assert callable(getattr(module, name))
+
+
 class TestSchemaImports:
     def test_import_conversation_schema(self):
         from src.schemas.conversation_schema import (
@@ -17,11 +38,6 @@ class TestSchemaImports:
         assert Speaker.AGENT == "agent"
         assert CallOutcome.BOOKING_MADE == "booking_made"
 
-    def test_import_booking_schema(self):
-        from src.schemas.booking_schema import BookingRequest
-
-        assert BookingRequest is not None
-
     def test_import_customer_schema(self):
         from src.schemas.customer_schema import SessionData
 
@@ -61,20 +77,6 @@ class TestToolImports:
 
         assert len(SERVICE_CATALOG) >= 6
 
-    def test_import_availability(self):
-        from src.tools.availability import check_availability
-
-        assert callable(check_availability)
-
-    def test_import_booking(self):
-        from src.tools.booking import create_booking
-
-        assert callable(create_booking)
-
-    def test_import_customer(self):
-        from src.tools.customer import lookup_customer
-
-        assert callable(lookup_customer)
 
 
 class TestPromptImports:
@@ -87,13 +89,6 @@ class TestPromptImports:
         assert "intake agent" in INTAKE_SYSTEM_PROMPT.lower()
         assert "booking specialist" in BOOKING_SYSTEM_PROMPT.lower()
 
-    def test_import_prompt_templates(self):
-        from src.prompts.prompt_templates import (
-            build_slot_collection_prompt,
-        )
-
-        assert callable(build_slot_collection_prompt)
-
 
 class TestEvalImports:
     def test_import_metrics(self):
@@ -119,13 +114,6 @@ class TestEvalImports:
         analyzer = TranscriptAnalyzer()
         assert analyzer is not None
 
-    def test_import_eval_package(self):
-        from src.evaluation import (
-            TranscriptAnalyzer,
-        )
-
-        assert TranscriptAnalyzer is not None
-
 
 class TestAgentRegistry:
     def test_registry_has_all_agents(self):
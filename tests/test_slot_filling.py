@@ -6,72 +6,43 @@ from src.conversation.slot_manager import SlotStatus
 
 
 class TestSlotSetAndValidation:
-    def test_set_valid_name(self, slot_manager):
-        ok, msg = slot_manager.set_slot("customer_name", "John Smith")
+    @pytest.mark.parametrize(
+        ("slot", "raw", "expected"),
+        [
+            ("customer_name", "John Smith", "John Smith"),
+            ("customer_name", "john smith", "John Smith"),
+            ("customer_phone", "0412 345 678", "0412345678"),
+            ("customer_phone", "+61 412 345 678", "+61412345678"),
+            ("customer_phone", "(04) 1234-5678", "0412345678"),
+            ("service_type", "plumbing", None),
+            ("service_type", "plumbing repair", None),
+            ("customer_address", "42 Oak Avenue, Richmond VIC 3121", None),
+            ("preferred_date", "2025-03-18", "2025-03-18"),
+            ("preferred_time", "10:00", None),
+            ("job_description", "Kitchen sink is leaking", None),
+        ],
+    )
+    def test_set_valid(self, slot_manager, slot, raw, expected):
+        ok, _ = slot_manager.set_slot(slot, raw)
         assert ok is True
-        assert slot_manager.get_slot_value("customer_name") == "John Smith"
-
-    def test_set_name_normalizes_to_title_case(self, slot_manager):
-        ok, _ = slot_manager.set_slot("customer_name", "john smith")
-        assert ok is True
-        assert slot_manager.get_slot_value("customer_name") == "John Smith"
-
-    def test_set_invalid_name_too_short(self, slot_manager):
-        ok, msg = slot_manager.set_slot("customer_name", "J")
+        if expected is not None:
+            assert slot_manager.get_slot_value(slot) == expected
+
+    @pytest.mark.parametrize(
+        ("slot", "raw"),
+        [
+            ("customer_name", "J"),
+            ("customer_phone", "123"),
+            ("customer_phone", "12345"),
+            ("service_type", "landscaping"),
+            ("customer_address", "42"),
+        ],
+    )
+    def test_set_invalid(self, slot_manager, slot, raw):
+        ok, msg = slot_manager.set_slot(slot, raw)
         assert ok is False
         assert "doesn't look right" in msg
 
-    def test_set_valid_phone(self, slot_manager):
-        ok, _ = slot_manager.set_slot("customer_phone", "0412 345 678")
-        assert ok is True
-        assert slot_manager.get_slot_value("customer_phone") == "0412345678"
-
-    def test_set_valid_phone_international(self, slot_manager):
-        ok, _ = slot_manager.set_slot("customer_phone", "+61 412 345 678")
-        assert ok is True
-        assert slot_manager.get_slot_value("customer_phone") == "+61412345678"
-
-    def test_set_invalid_phone_too_short(self, slot_manager):
-        ok, msg = slot_manager.set_slot("customer_phone", "123")
-        assert ok is False
-
-    def test_set_invalid_phone_too_few_digits(self, slot_manager):
-        ok, msg = slot_manager.set_slot("customer_phone", "12345")
-        assert ok is False
-
-    def test_set_valid_service(self, slot_manager):
-        ok, _ = slot_manager.set_slot("service_type", "plumbing")
-        assert ok is True
-
-    def test_set_valid_service_partial_match(self, slot_manager):
-        ok, _ = slot_manager.set_slot("service_type", "plumbing repair")
-        assert ok is True
-
-    def test_set_invalid_service(self, slot_manager):
-        ok, msg = slot_manager.set_slot("service_type", "landscaping")
-        assert ok is False
-
-    def test_set_valid_address(self, slot_manager):
-        ok, _ = slot_manager.set_slot("customer_address", "42 Oak Avenue, Richmond VIC 3121")
-        assert ok is True
-
-    def test_set_invalid_address_too_short(self, slot_manager):
-        ok, msg = slot_manager.set_slot("customer_address", "42")
-        assert ok is False
-
-    def test_set_date_no_validator(self, slot_manager):
-        ok, _ = slot_manager.set_slot("preferred_date", "2025-03-18")
-        assert ok is True
-        assert slot_manager.get_slot_value("preferred_date") == "2025-03-18"
-
-    def test_set_time_no_validator(self, slot_manager):
-        ok, _ = slot_manager.set_slot("preferred_time", "10:00")
-        assert ok is True
-
-    def test_set_optional_job_description(self, slot_manager):
-        ok, _ = slot_manager.set_slot("job_description", "Kitchen sink is leaking")
-        assert ok is True
-
 
 class TestSlotStatus:
     def test_empty_slot_status(self, slot_manager):
@@ -111,34 +82,22 @@ class TestCorrections:
 
 
 class TestConfirmationGate:
-    def _fill_required(self, sm):
-        sm.set_slot("customer_name", "John Smith")
-        sm.set_slot("customer_phone", "0412345678")
-        sm.set_slot("service_type", "plumbing")
-        sm.set_slot("preferred_date", "2025-03-18")
-        sm.set_slot("preferred_time", "10:00")
-        sm.set_slot("customer_address", "42 Oak Avenue, Richmond VIC 3121")
-
-    def test_all_required_filled(self, slot_manager):
-        self._fill_required(slot_manager)
-        assert slot_manager.all_required_filled() is True
+    def test_all_required_filled(self, filled_slot_manager):
+        assert filled_slot_manager.all_required_filled() is True
 
     def test_not_all_filled_when_missing(self, slot_manager):
         slot_manager.set_slot("customer_name", "John Smith")
         assert slot_manager.all_required_filled() is False
 
-    def test_not_confirmed_before_confirm_all(self, slot_manager):
-        self._fill_required(slot_manager)
-        assert slot_manager.all_confirmed() is False
+    def test_not_confirmed_before_confirm_all(self, filled_slot_manager):
+        assert filled_slot_manager.all_confirmed() is False
 
-    def test_confirmed_after_confirm_all(self, slot_manager):
-        self._fill_required(slot_manager)
-        slot_manager.confirm_all()
-        assert slot_manager.all_confirmed() is True
+    def test_confirmed_after_confirm_all(self, filled_slot_manager):
+        filled_slot_manager.confirm_all()
+        assert filled_slot_manager.all_confirmed() is True
 
-    def test_confirmation_summary_includes_all_fields(self, slot_manager):
-        self._fill_required(slot_manager)
-        summary = slot_manager.get_confirmation_summary()
+    def test_confirmation_summary_includes_all_fields(self, filled_slot_manager):
+        summary = filled_slot_manager.get_confirmation_summary()
         assert "John Smith" in summary
         assert "0412345678" in summary
         assert "plumbing" in summary
@@ -146,9 +105,8 @@ class TestConfirmationGate:
         assert "10:00" in summary
         assert "42 Oak Avenue" in summary
 
-    def test_confirmation_summary_excludes_optional(self, slot_manager):
-        self._fill_required(slot_manager)
-        summary = slot_manager.get_confirmation_summary()
+    def test_confirmation_summary_excludes_optional(self, filled_slot_manager):
+        summary = filled_slot_manager.get_confirmation_summary()
         assert "job description" not in summary
 
 
@@ -181,14 +139,8 @@ class TestSlotNavigation:
         assert next_slot is not None
         assert next_slot.name == "customer_phone"
 
-    def test_get_next_empty_slot_none_when_full(self, slot_manager):
-        slot_manager.set_slot("customer_name", "John Smith")
-        slot_manager.set_slot("customer_phone", "0412345678")
-        slot_manager.set_slot("service_type", "plumbing")
-        slot_manager.set_slot("preferred_date", "2025-03-18")
-        slot_manager.set_slot("preferred_time", "10:00")
-        slot_manager.set_slot("customer_address", "42 Oak Avenue, Richmond VIC 3121")
-        assert slot_manager.get_next_empty_slot() is None
+    def test_get_next_empty_slot_none_when_full(self, filled_slot_manager):
+        assert filled_slot_manager.get_next_empty_slot() is None
 
     def test_get_missing_slots(self, slot_manager):
         slot_manager.set_slot("customer_name", "John Smith")
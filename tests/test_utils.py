@@ -1,26 +1,37 @@
 """Tests for shared utility functions."""
 
-from src.utils import normalize_phone
+import pytest
 
+from src.utils import canonical_phone, normalize_phone
 
-class TestNormalizePhone:
-    def test_strips_spaces(self):
-        assert normalize_phone("0412 345 678") == "0412345678"
-
-    def test_strips_dashes(self):
-        assert normalize_phone("0412-345-678") == "0412345678"
-
-    def test_strips_parentheses(self):
-        assert normalize_phone("(04) 1234 5678") == "0412345678"
-
-    def test_preserves_leading_plus(self):
-        assert normalize_phone("+61 412 345 678") == "+61412345678"
 
-    def test_clean_number_unchanged(self):
-        assert normalize_phone("0412345678") == "0412345678"
-
-    def test_strips_whitespace(self):
-        assert normalize_phone("  0412345678  ") == "0412345678"
-
-    def test_mixed_separators(self):
-        assert normalize_phone("+61 (412) 345-678") == "+61412345678"
+class TestNormalizePhone:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("0412 345 678", "0412345678"),
+            ("0412-345-678", "0412345678"),
+            ("(04) 1234 5678", "0412345678"),
+            ("+61 412 345 678", "+61412345678"),
+            ("0412345678", "0412345678"),
+            ("  0412345678  ", "0412345678"),
+            ("+61 (412) 345-678", "+61412345678"),
+            ("tel: 0412/345/678", "0412345678"),
+        ],
+    )
+    def test_normalizes(self, raw, expected):
+        assert normalize_phone(raw) == expected
+
+
+class TestCanonicalPhone:
+    def test_local_number_unchanged(self):
+        assert canonical_phone("0412 345 678") == "0412345678"
+
+    def test_country_code_becomes_leading_zero(self):
+        assert canonical_phone("+61 (412) 345-678") == "0412345678"
+
+    def test_spaced_country_code(self):
+        assert canonical_phone(" + 61 412 345 678") == "0412345678"
+
+    def test_other_country_code_kept(self):
+        assert canonical_phone("+64 21 345 678") == "+6421345678"